@@ -0,0 +1,394 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+Author:
+    Graham Steeds
+
+Context:
+    This module provides an on-disk cache for fund pricing data.
+
+Description:
+    Retrieving fund data over the network is by far the slowest operation performed by
+    Fund Tracker. PriceCache stores the data for each fund in a SQLite database so that
+    repeated requests covering the same dates can be answered without a network
+    request.
+
+    For each fund the cache records the currency, instrument type, the ranges of dates
+    which have been retrieved, and the closing price for each date within those
+    ranges. Overlapping and adjacent ranges are combined, while separate ranges are
+    kept. A request is only answered from the cache when the requested dates fall
+    entirely within a range which has been retrieved.
+
+    Prices for the day on which data was retrieved may still change, for example when
+    retrieved before the market closes. The cache records that provisional day and when
+    it was retrieved, and requests including it are only answered from the cache for
+    DEFAULT_CACHE_TTL seconds after retrieval. Retrievals ending before the current day
+    do not change the provisional day, unless they cover it, in which case its prices
+    are final. Prices for earlier days are final and do not expire.
+
+Attributes:
+    CACHE_LOG_LEVEL: Default log level when this module is called directly.
+    CACHE_SCHEMA_VERSION: Version of the layout of the cache database. A cache with a
+        different version is emptied when opened.
+    DEFAULT_CACHE_FILENAME: Default filename for the cache database.
+    DEFAULT_CACHE_LOG_FILENAME: Default filename for logging when module called
+        directly.
+    DEFAULT_CACHE_TTL: Number of seconds for which prices for the day of retrieval are
+        answered from the cache.
+
+Composition Attributes:
+    Line length = 88 characters.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+
+# Local imports.
+from log_config import configure_logging
+
+
+CACHE_LOG_LEVEL = logging.WARNING
+CACHE_SCHEMA_VERSION = 3
+DEFAULT_CACHE_FILENAME = 'yf_cache.sqlite'
+DEFAULT_CACHE_LOG_FILENAME = 'cache.log'  # Used when __name__ == '__main__'
+DEFAULT_CACHE_TTL = 60 * 60  # 1 hour, in seconds.
+
+# Configure logging.
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class CacheError(RuntimeError):
+    """Base class for exceptions arising from this module."""
+
+
+class PriceCache:
+    """Store and retrieve fund pricing data using SQLite.
+
+    A single connection is shared between threads, with access serialized by a lock.
+
+    Args:
+        cache_file (str): OPTIONAL. Filename for the cache database. Will create new
+            file with that name if one does not exist.
+        ttl (int or float): OPTIONAL. Number of seconds for which prices for the day of
+            retrieval are answered from the cache.
+    """
+
+    def __init__(self, cache_file=DEFAULT_CACHE_FILENAME, ttl=DEFAULT_CACHE_TTL):
+
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        try:
+            # isolation_level=None leaves the connection in autocommit mode.
+            self._connection = sqlite3.connect(
+                cache_file,
+                isolation_level=None,
+                check_same_thread=False
+            )
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+
+            # The cache can always be retrieved again, so a cache with a different
+            # layout is emptied rather than converted.
+            version = self._connection.execute('PRAGMA user_version').fetchone()[0]
+            if version != CACHE_SCHEMA_VERSION:
+                for table in ('prices', 'meta', 'ranges'):
+                    self._connection.execute(f'DROP TABLE IF EXISTS {table}')
+                self._connection.execute(f'PRAGMA user_version={CACHE_SCHEMA_VERSION}')
+
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS prices ('
+                'symbol TEXT, d TEXT, close REAL, PRIMARY KEY(symbol, d))'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS meta ('
+                'symbol TEXT PRIMARY KEY, currency TEXT, instrument_type TEXT, '
+                'provisional_date TEXT, provisional_fetch TEXT)'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS ranges ('
+                'symbol TEXT, start_date TEXT, end_date TEXT, '
+                'PRIMARY KEY(symbol, start_date))'
+            )
+        except sqlite3.Error as e:
+            msg = f'Unable to open cache: {cache_file}. {e}'
+            log.warning(msg)
+            raise CacheError(msg)
+
+    def covers(self, symbol, start_date, end_date):
+        """Check whether get() would answer a request from the cache.
+
+        Unlike get(), no prices are read.
+
+        Args:
+            symbol (str): First parameter. Symbol for fund. Ex: 'FXAIX'.
+            start_date (str): Second parameter. Start date (yyyy-mm-dd).
+            end_date (str): Third parameter. End date (yyyy-mm-dd).
+
+        Returns:
+            (bool): True when the dates are covered by the cache, False otherwise.
+
+        Raises:
+            CacheError: When data cannot be read from the cache.
+        """
+
+        with self._lock:
+            try:
+                return self._covering_meta(symbol, start_date, end_date) is not None
+            except sqlite3.Error as e:
+                msg = f'Unable to read data for {symbol} from cache. {e}'
+                log.warning(msg)
+                raise CacheError(msg)
+
+    def get(self, symbol, start_date, end_date):
+        """Get cached data for a fund between argument dates.
+
+        Args:
+            symbol (str): First parameter. Symbol for fund. Ex: 'FXAIX'.
+            start_date (str): Second parameter. Start date (yyyy-mm-dd).
+            end_date (str): Third parameter. End date (yyyy-mm-dd).
+
+        Returns:
+            (list[symbol, denomination, type, list[[date, price]]] or None): Cached
+                fund data when the dates are covered by the cache, None otherwise.
+
+        Raises:
+            CacheError: When data cannot be read from the cache.
+        """
+
+        log.debug('Get cached data for %s between %s and %s...',
+                  symbol, start_date, end_date)
+
+        with self._lock:
+            try:
+                meta = self._covering_meta(symbol, start_date, end_date)
+                if meta is None:
+                    return None
+
+                cursor = self._connection.execute(
+                    'SELECT d, close FROM prices WHERE symbol = ? AND d BETWEEN ? AND '
+                    '? ORDER BY d',
+                    (symbol, start_date, end_date)
+                )
+                # Build rows directly from the cursor rather than from fetchall(),
+                # which would allocate an intermediate list of tuples.
+                dates_prices = list(map(list, cursor))
+            except sqlite3.Error as e:
+                msg = f'Unable to read data for {symbol} from cache. {e}'
+                log.warning(msg)
+                raise CacheError(msg)
+
+        log.debug('Cache hit for %s.', symbol)
+
+        return [symbol, meta[0], meta[1], dates_prices]
+
+    def _covering_meta(self, symbol, start_date, end_date):
+        """Get the cached details of a fund when they cover the argument dates.
+
+        Must be called while holding self._lock.
+
+        Args:
+            symbol (str): First parameter. Symbol for fund. Ex: 'FXAIX'.
+            start_date (str): Second parameter. Start date (yyyy-mm-dd).
+            end_date (str): Third parameter. End date (yyyy-mm-dd).
+
+        Returns:
+            meta (tuple(currency, instrument_type, provisional_date,
+                provisional_fetch) or None): Details of the fund, or None when the
+                dates are not covered or have expired.
+
+        Raises:
+            sqlite3.Error: When data cannot be read from the cache.
+        """
+
+        meta = self._connection.execute(
+            'SELECT currency, instrument_type, provisional_date, '
+            'provisional_fetch FROM meta '
+            'WHERE symbol = ?',
+            (symbol,)
+        ).fetchone()
+
+        # Ranges are combined when saved, so the argument dates must fall within a
+        # single range. ISO dates can be compared as strings.
+        covering_range = self._connection.execute(
+            'SELECT 1 FROM ranges WHERE symbol = ? AND start_date <= ? AND '
+            'end_date >= ?',
+            (symbol, start_date, end_date)
+        ).fetchone()
+
+        if meta is None or covering_range is None:
+            log.debug('Cache miss for %s.', symbol)
+            return None
+
+        # Prices from the provisional day onwards may have changed since they were
+        # retrieved, so they are only used until they expire.
+        provisional_date, provisional_fetch = meta[2:]
+        if provisional_date is not None and end_date >= provisional_date:
+            expires = \
+                datetime.fromisoformat(provisional_fetch) + timedelta(seconds=self.ttl)
+            if expires < datetime.now():
+                log.debug('Cache entry for %s expired.', symbol)
+                return None
+
+        return meta
+
+    def put(self, data, start_date, end_date):
+        """Save fund data retrieved between argument dates.
+
+        The argument dates are added to the ranges already cached for the fund. When
+        they overlap or are adjacent to a cached range the ranges are combined. Prices
+        previously cached between the argument dates are replaced. When the dates reach
+        the current day it becomes the provisional day for the fund.
+
+        Args:
+            data (list[symbol, denomination, type, list[[date, price]]]): First
+                parameter. Fund data as returned by pull_from_yf.
+            start_date (str): Second parameter. Start date (yyyy-mm-dd) of retrieval.
+            end_date (str): Third parameter. End date (yyyy-mm-dd) of retrieval.
+
+        Returns:
+            data (list[symbol, denomination, type, list[[date, price]]]): Data that
+                was saved.
+
+        Raises:
+            CacheError: When data cannot be written to the cache.
+        """
+
+        symbol, currency, instrument_type, dates_prices = data[:4]
+
+        log.debug('Put data for %s between %s and %s...', symbol, start_date, end_date)
+
+        with self._lock:
+            try:
+                # Take the write lock before reading the cached ranges, so that they
+                # cannot change before the combined ranges are written.
+                self._connection.execute('BEGIN IMMEDIATE')
+
+                cached_ranges = self._connection.execute(
+                    'SELECT start_date, end_date FROM ranges WHERE symbol = ?',
+                    (symbol,)
+                ).fetchall()
+                ranges = _combine_ranges(cached_ranges + [(start_date, end_date)])
+
+                provisional = self._connection.execute(
+                    'SELECT provisional_date, provisional_fetch FROM meta '
+                    'WHERE symbol = ?',
+                    (symbol,)
+                ).fetchone() or (None, None)
+                today = date.today().isoformat()
+                if end_date >= today:
+                    provisional = (today, datetime.now().isoformat(timespec='seconds'))
+                elif provisional[0] is not None and \
+                        start_date <= provisional[0] <= end_date:
+                    # Retrieved after the provisional day, so its prices are final.
+                    provisional = (None, None)
+
+                # The retrieved data replaces whatever was cached for its dates.
+                self._connection.execute(
+                    'DELETE FROM prices WHERE symbol = ? AND d BETWEEN ? AND ?',
+                    (symbol, start_date, end_date)
+                )
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO prices (symbol, d, close) VALUES (?, ?, ?)',
+                    [(symbol, dp[0], dp[1]) for dp in dates_prices]
+                )
+                self._connection.execute(
+                    'DELETE FROM ranges WHERE symbol = ?', (symbol,))
+                self._connection.executemany(
+                    'INSERT INTO ranges VALUES (?, ?, ?)',
+                    [(symbol, start, end) for start, end in ranges]
+                )
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO meta VALUES (?, ?, ?, ?, ?)',
+                    (symbol, currency, instrument_type) + tuple(provisional)
+                )
+                self._connection.execute('COMMIT')
+            except sqlite3.Error as e:
+                # BEGIN itself may have failed, leaving no transaction to roll back.
+                if self._connection.in_transaction:
+                    self._connection.execute('ROLLBACK')
+                msg = f'Unable to save data for {symbol} to cache. {e}'
+                log.warning(msg)
+                raise CacheError(msg)
+
+        log.debug('Put data for %s complete.', symbol)
+
+        return data
+
+    def close(self):
+        """Close connection to the cache database.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        log.debug('Closing cache: %s.', self.cache_file)
+
+        with self._lock:
+            self._connection.close()
+
+
+def _combine_ranges(ranges):
+    """Combine overlapping and adjacent date ranges.
+
+    Args:
+        ranges (list[(start_date, end_date)]): Date ranges as (yyyy-mm-dd, yyyy-mm-dd)
+            pairs, in any order.
+
+    Returns:
+        combined (list[(start_date, end_date)]): Ranges sorted by start date, with
+            ranges which overlap or are adjacent combined into one.
+    """
+
+    combined = []
+    for start_date, end_date in sorted(ranges):
+        if combined:
+            previous_start, previous_end = combined[-1]
+            day_after = date.fromisoformat(previous_end) + timedelta(days=1)
+            # ISO dates can be compared as strings.
+            if start_date <= day_after.isoformat():
+                combined[-1] = (previous_start, max(previous_end, end_date))
+                continue
+        combined.append((start_date, end_date))
+
+    return combined
+
+
+def test():
+    """For development level module testing."""
+
+    pass
+
+
+def cache_self_test():
+    """Run Unittests on module.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    import unittest
+
+    from tests import test_cache
+
+    # Conduct unittest.
+    suite = unittest.TestLoader().loadTestsFromModule(test_cache)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+if __name__ == '__main__':
+    # Configure Rotating Log. Only runs when module is called directly.
+    configure_logging(log, DEFAULT_CACHE_LOG_FILENAME, CACHE_LOG_LEVEL)
+
+    cache_self_test()
@@ -11,10 +11,12 @@ Context:
     traded in a financial market.
 
 Attributes:
+    BULK_PARSE_THRESHOLD: Number of dates above which _parse_dates() bypasses the date
+        cache.
     CORE_LOG_LEVEL: Default log level when this module is called directly.
+    DATE_CACHE_SIZE: Maximum number of parsed dates held by _parse_date().
     DATE_FORMAT: Format for working with dates. (yyyy-mm-dd).
     DEFAULT_CORE_LOG_FILENAME: Default filename for logging when module called directly.
-    RUNTIME_ID: Generate a unique uuid object. Used in logging.
 
 Composition Attributes:
     Line length = 88 characters.
@@ -22,20 +24,42 @@ Composition Attributes:
 
 import bisect
 import logging
-import uuid
-from datetime import date, datetime, timedelta
-from logging import handlers
+import math
+import sys
+from array import array
+from datetime import date, timedelta
+from operator import itemgetter
 
+# Local imports.
+from log_config import configure_logging
 
+
+BULK_PARSE_THRESHOLD = 1024
 CORE_LOG_LEVEL = logging.WARNING
+DATE_CACHE_SIZE = 65536
 DATE_FORMAT = '%Y-%m-%d'
 DEFAULT_CORE_LOG_FILENAME = 'core.log'  # Used when __name__ == '__main__'
-RUNTIME_ID = uuid.uuid4()
 
-# Configure logging.
+# Configure logging. Messages pass their values as %-style arguments rather than
+# f-strings, so they are only formatted when a handler accepts the record.
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Get the date or price from a [date, price] pair in C rather than with a lambda.
+_DATE = itemgetter(0)
+_PRICE = itemgetter(1)
+
+# Periods used to find past prices for performance.
+_ONE_DAY = timedelta(days=1)
+_ONE_WEEK = timedelta(weeks=1)
+_ONE_YEAR = timedelta(weeks=52)
+
+# Shared format string for past performances: message, then value.
+_PERF_FMT = '{:18}: {:+6.2f}'
+
+# Parsed dates keyed by date string. Funds loaded over the same dates share entries.
+_DATE_CACHE = {}
+
 
 class CoreError(RuntimeError):
     """Base class for exceptions arising from this module."""
@@ -50,19 +74,68 @@ class Fund:
         currency (str): Second parameter. Symbol of trading currency such as 'USD'.
         instrument_type (str): Third parameter. Type of fund. Example: 'MUTUALFUND' or
             'STOCK'.
-        dates_prices (list[['yyyy-mm-dd', 'float']]): Fourth parameter. List of lists
-            containing date and price data.
+        dates_prices (iterable[['yyyy-mm-dd', 'float']]): Fourth parameter. List of
+            lists, or any iterable of pairs, containing date and price data.
         name (str): OPTIONAL. An optional given name or nickname for fund by user.
     """
 
+    # Fixed attributes, so instances do not each carry a __dict__.
+    __slots__ = (
+        'symbol', 'currency', 'instrument_type', 'dates', 'prices', 'name',
+        '_performance', '_str'
+    )
+
     def __init__(self, symbol, currency, instrument_type, dates_prices, name=None):
-        self.symbol = symbol.upper()  # Fund symbol. Ex. 'FXAIX'.
-        self.currency = currency.upper()  # Currency of fund. Ex. 'USD'.
-        self.instrument_type = instrument_type.upper()  # Ex. 'STOCK'.
-        # Turn date string into datetime object in yyyy-mm-dd format.
-        self.dates_prices = [[datetime.strptime(dp[0], DATE_FORMAT).date(), dp[1]]
-                             for dp in dates_prices]
+        # Interned so that funds share one copy of each string, and comparisons of
+        # equal strings can succeed on identity.
+        self.symbol = sys.intern(symbol.upper())  # Fund symbol. Ex. 'FXAIX'.
+        self.currency = sys.intern(currency.upper())  # Currency of fund. Ex. 'USD'.
+        self.instrument_type = sys.intern(instrument_type.upper())  # Ex. 'STOCK'.
+        # Dates and prices are held in separate, parallel columns. Rows are transposed
+        # into both columns in a single pass, so dates_prices may also be an iterator.
+        # Date strings are then turned into date objects, and prices are packed into
+        # an array of C doubles, with NaN standing in for missing prices.
+        date_strs, prices = tuple(zip(*dates_prices)) or ((), ())
+        self.dates = _parse_dates(date_strs)
+        self.prices = array('d', [math.nan if p is None else p for p in prices])
         self.name = name  # Optional name for fund given by user.
+        # Results of day, week and year performance, calculated on first request.
+        # Dates and prices are not changed after the fund is created.
+        self._performance = {}
+        # Name and result of the last call to __str__.
+        self._str = (None, None)
+
+    @classmethod
+    def from_data(cls, data, name=None):
+        """Create a Fund from data in the format returned by data sources.
+
+        The name is given separately, so data sources do not need to add it to data.
+
+        Args:
+            data (list[symbol, currency, type, list[[date, price]]]): First parameter.
+                Fund data as returned by a data source, such as pull_from_yf.
+            name (str or None): Second parameter. OPTIONAL. An optional given name or
+                nickname for fund by user. An empty string is treated as no name.
+
+        Returns:
+            fund (Fund): Fund created from data.
+        """
+
+        symbol, currency, instrument_type, dates_prices = data
+
+        return cls(symbol, currency, instrument_type, dates_prices, name or None)
+
+    @property
+    def dates_prices(self):
+        """list[[date, price]]: Dates and associated prices as a list of lists.
+
+        Built from self.dates and self.prices on each access, so changes to the
+        returned list do not change the fund. Missing prices are returned as None.
+        """
+
+        return [
+            [d, None if math.isnan(p) else p] for d, p in zip(self.dates, self.prices)
+        ]
 
     def __str__(self):
         """String representation of Fund.
@@ -76,25 +149,28 @@ class Fund:
                     'FSMAX -\nUSD - MUTUALFUND\nLatest price: 2022-04-05 - $78.42'
         """
 
-        log.debug(f'__str__ ({self.__repr__()})...')
+        log.debug('__str__ (%s)...', self.symbol)
+
+        # Reuse the string from a previous call, unless the name has since changed.
+        name, formatted_str = self._str
+        if formatted_str is not None and name == self.name:
+            return formatted_str
 
         # Get the latest price and round it to 2 decimal places.
-        if self.dates_prices[-1][1]:
-            formatted_price = '{:.2f}'.format(self.dates_prices[-1][1])
-        else:  # Use previous days data when latest data is not available.
-            formatted_price = '{:.2f}'.format(self.dates_prices[-2][1])
-
-        formatted_str = '{} - {}\n{} - {}\nLatest price: {} - ${}'.\
-            format(
-                self.symbol,
-                self.name or '',
-                self.currency,
-                self.instrument_type,
-                self.dates_prices[-1][0],
-                formatted_price
-            )
+        price = self.prices[-1]
+        # Use previous days data when latest data is not available. Missing prices are
+        # held as NaN, while 0.0 is a price.
+        if math.isnan(price):
+            price = self.prices[-2]
+
+        formatted_str = (
+            f'{self.symbol} - {self.name or ""}\n'
+            f'{self.currency} - {self.instrument_type}\n'
+            f'Latest price: {self.dates[-1]} - ${price:.2f}'
+        )
+        self._str = (self.name, formatted_str)
 
-        log.debug(f'__str__ ({self.__repr__()}) complete...')
+        log.debug('__str__ (%s) complete...', self.symbol)
 
         return formatted_str
 
@@ -108,8 +184,6 @@ class Fund:
             self.symbol (str): The symbol for the Fund.
         """
 
-        log.debug(f'__repr__ ({self.symbol}) complete.')
-
         return self.symbol
 
     def __eq__(self, other):
@@ -122,27 +196,33 @@ class Fund:
             if Fund.symbol == other.symbol, or if Fund.symbol == other.
 
         Returns:
-            True if found to be the same, False otherwise.
+            True if found to be the same, False otherwise. NotImplemented when other is
+                not a Fund or str, so that Python falls back to its default comparison.
+                Ex. fund == None is False.
         """
 
-        log.debug(f'__eq__ (self: {self.__repr__()}, other: {other})...')
+        # Called for every membership test on a list of funds, so no logging here.
+        if isinstance(other, Fund):
+            return self.symbol == other.symbol
 
-        if isinstance(other, Fund):  # Compare if type(other) is Fund.
-            log.debug(f'__eq__ (other type = {type(other)}, '
-                      f'self is other = '
-                      f'{True if self.symbol == other.symbol else False}')
-            return True if self.symbol == other.symbol else False
+        if isinstance(other, str):
+            return self.symbol == other
 
-        elif isinstance(other, str):  # Compare if type(other) is str.
-            log.debug(f'__eq__ (other type = {type(other)}, '
-                      f'self is other = '
-                      f'{True if self.symbol == other else False}')
-            return True if self.symbol == other else False
+        return NotImplemented
 
-        else:  # When type other is not a legal type. i.e. a Fund or str.
-            msg = f'Type {type(other)} is not a legally comparable type.'
-            log.warning(msg)
-            raise CoreError(msg)
+    def __hash__(self):
+        """Hash of self.symbol, consistent with __eq__.
+
+        Allows funds to be held in sets and used as dictionary keys.
+
+        Args:
+            None
+
+        Returns:
+            (int): Hash of the fund symbol.
+        """
+
+        return hash(self.symbol)
 
     def generate_fund_performance_str(self, day=True, week=True, year=True):
         """Generates previous 24 hour, week, and year performance of fund
@@ -163,28 +243,23 @@ class Fund:
         # TODO (GS): Add graph height and length characteristics to arguments.
         """
 
-        log.debug(f'Generate fund perf str ({self.__repr__()})...')
+        log.debug('Generate fund perf str (%s)...', self.symbol)
 
-        performance = '\n' + self.__str__()
-
-        fmt = "\n{:18}: {:+6.2f}"  # shared format string for past performances
-        #         msg    value     # + means always include +/- for pos/neg
-        # lines up messages and percent changes
+        parts = ['', str(self)]
 
+        # + means always include +/- for pos/neg, and lines up messages and percent
+        # changes.
         if day:
-            performance += fmt.format('Previous 24 hours',
-                                      self.day_performance())
+            parts.append(_PERF_FMT.format('Previous 24 hours', self.day_performance()))
         if week:
-            performance += fmt.format('Previous week',
-                                      self.week_performance())
-
+            parts.append(_PERF_FMT.format('Previous week', self.week_performance()))
         if year:
-            performance += fmt.format('Previous year',
-                                      self.year_performance())
+            parts.append(_PERF_FMT.format('Previous year', self.year_performance()))
 
-        log.debug(f'Generate fund perf str ({self.__repr__()}) complete.')
+        log.debug('Generate fund perf str (%s) complete.', self.symbol)
 
-        performance += '\n\n' + self.graph()
+        parts += ['', self.graph()]
+        performance = '\n'.join(parts)
 
         return performance
 
@@ -220,43 +295,49 @@ class Fund:
 
         # Find start date based off current_date.
         previous_date_, previous_price = \
-            self.get_most_current_price(current_date_ - timedelta(weeks=52))
+            self.get_most_current_price(current_date_ - _ONE_YEAR)
 
         # Create new list containing dates and prices between the previous and current
-        # dates.
-        lst = [dp for dp in self.dates_prices if
-               previous_date_ <= dp[0] <= current_date_]
+        # dates, skipping dates without a price. The range is located with bisect so
+        # that only its rows are visited.
+        start = bisect.bisect_left(self.dates, previous_date_)
+        end = bisect.bisect_right(self.dates, current_date_)
+        lst = [[d, p] for d, p in zip(self.dates[start:end], self.prices[start:end])
+               if not math.isnan(p)]
 
         # Confirm that lst is in order from least to greatest date.
         # (oldest to most recent)
-        lst.sort(key=lambda date_price: date_price[0])
+        lst.sort(key=_DATE)
 
         # List of data matching the length argument.
         data = self._trim_list(lst, length)
 
         # Find highest and lowest price, as well as the difference between the two.
-        highest_price = max(data, key=lambda dp: dp[1])
-        lowest_price = min(data, key=lambda dp: dp[1])
+        highest_price = max(data, key=_PRICE)
+        lowest_price = min(data, key=_PRICE)
         price_difference = highest_price[1] - lowest_price[1]
 
         # Find pricing difference from one row to another.
         row_price_difference = price_difference / height
 
-        # Modify graph_lst so dates are replaced with row height position.
-        for dp in data:
-            row_found = False
-            graph_row = 0
-            price_segment = row_price_difference
-            while row_found is False:
-                if dp[1] <= price_segment + lowest_price[1]:
-                    dp[0] = graph_row
-                    row_found = True
-                else:
-                    graph_row += 1
-                    price_segment += row_price_difference
+        # Find the row height position of each price, parallel to data, which is left
+        # unchanged. A price belongs to the lowest row whose upper bound it does not
+        # exceed, which is calculated directly rather than by stepping up one row at a
+        # time. Rows are limited to the graph so that rounding cannot push the highest
+        # price off it.
+        lowest = lowest_price[1]
+        top_row = height - 1
+        if row_price_difference:
+            rows = [
+                min(max(math.ceil((dp[1] - lowest) / row_price_difference) - 1, 0),
+                    top_row)
+                for dp in data
+            ]
+        else:  # All prices are the same.
+            rows = [0] * len(data)
 
         graph = self._construct_graph(
-                    data,
+                    rows,
                     height,
                     length,
                     lowest_price,
@@ -282,28 +363,26 @@ class Fund:
                 argument and representing a cross-section of the lst argument.
         """
 
-        # Form a list of dates & prices that matches the length argument.
+        # Form a list of dates & prices that matches the length argument by picking
+        # every date/price whose index matches frequency, starting with the first.
         frequency = len(lst) // length  # Frequency of dates to pick.
-        data = []
-        for i in lst:
-            # Automatically pick first and last dates/prices.
-            if lst.index(i) == lst[0] or lst.index(i) == lst[-1]:
-                data.append(i)
-            # Pick dates/prices that match frequency.
-            elif lst.index(i) % frequency == 0:
-                data.append(i)
+        if not frequency:  # Fewer dates than length, so all of them are used.
+            return list(lst)
+        data = lst[::frequency]
 
         # Trim length of graph list.
-        # If index of last date/price in list % frequency != 0 there will be an extra
-        # entry. Trim the middle most date/price.
-        while len(data) > length:
-            data.pop(len(data) // 2)
+        # If index of last date/price in list % frequency != 0 there will be extra
+        # entries. Trim the middle most dates/prices, which form a single block.
+        excess = len(data) - length
+        if excess > 0:
+            middle = (length + 1) // 2
+            del data[middle:middle + excess]
 
         return data
 
     def _construct_graph(
             self,
-            data,
+            rows,
             height,
             length,
             lowest_price,
@@ -316,8 +395,8 @@ class Fund:
         Helper method for self.graph.
 
         Args:
-            data (list(list(date object, int))): First parameter. List of lists
-                containing dates and associated prices.
+            rows (list(int)): First parameter. Graph row of each data point, in date
+                order.
             height (int): Second parameter. Height of graph.
             length (int): Third parameter. Length of graph.
             lowest_price (list(datetime obj, float)): Fourth parameter. List where
@@ -331,38 +410,27 @@ class Fund:
         """
 
         fmt = '{:5.2f}'  # Format for y axis values.
-        graph = ''  # String on which the graph is drawn.
-        graph_complete = False
-        row = height - 1  # Graph row.
-
-        while graph_complete is False:
-
-            # Loop for each graph row.
-            for h in range(height):
-
-                # Loop for each data point in graph_lst.
-                for data_point in data:
-                    # Data point matches price category.
-                    if data_point[0] == row:
-                        graph += '*'
-                    # Data point does not match price category.
-                    else:
-                        graph += ' '
-
-                # Add the highest price to end of line at top of graph.
-                if row == height - 1:
-                    graph += '|' + '$' + fmt.format(highest_price[1]) + '\n'
-                # Add the lowest price to end of line at bottom of graph.
-                elif row == 0:
-                    graph += '|' + '$' + fmt.format(lowest_price[1]) + '\n'
-                # Rows that are not the top or bottom.
-                else:
-                    graph += '|\n'
-                # Increment row.
-                row -= 1
-
-            graph += ('_' * length) + '|'  # Draw x-axis.
-            graph_complete = True  # Graph structure complete.
+
+        # Plot each data point on a blank canvas of rows, with row 0 at the bottom.
+        canvas = [[' '] * len(rows) for _ in range(height)]
+        for column, graph_row in enumerate(rows):
+            canvas[graph_row][column] = '*'
+
+        # Add the highest price to end of line at top of graph, and the lowest price to
+        # end of line at bottom of graph. Rows are drawn from the top down.
+        top, bottom = height - 1, 0
+        lines = []
+        for row in range(top, -1, -1):
+            if row == top:
+                label = '|$' + fmt.format(highest_price[1])
+            elif row == bottom:
+                label = '|$' + fmt.format(lowest_price[1])
+            else:
+                label = '|'
+            lines.append(''.join(canvas[row]) + label)
+
+        lines.append('_' * length + '|')  # Draw x-axis.
+        graph = '\n'.join(lines)  # String on which the graph is drawn.
 
         # Place dates under x axis.
         earliest_date, latest_date = str(previous_date_), str(current_date_)
@@ -386,17 +454,12 @@ class Fund:
             difference(float): Difference in closing fund price.
         """
 
-        log.debug(f'Day performance ({self.__repr__()})...')
-
-        current_date_, current_price = self.get_most_current_price()
-        previous_date_, previous_price = \
-            self.get_most_current_price(self.dates_prices[-1][0] - timedelta(days=1))
+        log.debug('Day performance (%s)...', self.symbol)
 
-        difference = calculate_percentage(current_price, previous_price)
+        difference = self._get_performance()['day']
 
-        log.debug(f'Day performance ('
-                  f'fund: {self.__repr__()}, performance: {difference})'
-                  f' complete.')
+        log.debug('Day performance (fund: %s, performance: %s) complete.',
+                  self.symbol, difference)
 
         return difference
 
@@ -405,33 +468,18 @@ class Fund:
         from a week prior.
 
         Args:
-            fund (Fund): Fund object.
+            None
 
         Returns:
-            tuple(difference[float], Fund): tuple[0] returns the difference in
-            closing fund price. tuple[1] returns the Fund object.
+            difference(float): Difference in closing fund price.
         """
 
-        log.debug(f'Week performance ({self.__repr__()})...')
+        log.debug('Week performance (%s)...', self.symbol)
 
-        # Get most current date with price data.
-        most_current_date_price = self.get_most_current_price()
-        most_current_date = most_current_date_price[0]
-        most_current_price = most_current_date_price[1]
+        difference = self._get_performance()['week']
 
-        # Find the week before the latest price.
-        day_before = most_current_date - timedelta(weeks=1)
-
-        # Get the closest date with date and price data before the most_current_date.
-        day_before_date_price = self.get_most_current_price(day_before)
-        day_before_price = day_before_date_price[1]
-
-        # Calculate percentage difference in prices.
-        difference = calculate_percentage(day_before_price, most_current_price)
-
-        log.debug(f'Week performance ('
-                  f'fund: {self.__repr__()}, performance: {difference})'
-                  f' complete.')
+        log.debug('Week performance (fund: %s, performance: %s) complete.',
+                  self.symbol, difference)
 
         return difference
 
@@ -440,35 +488,59 @@ class Fund:
         from a year prior.
 
         Args:
-            fund (Fund): Fund object.
+            None
 
         Returns:
-            tuple(difference[float], Fund): tuple[0] returns the difference in
-            closing fund price. tuple[1] returns the Fund object.
+            difference(float): Difference in closing fund price.
         """
 
-        log.debug(f'Year performance ({self.__repr__()})...')
+        log.debug('Year performance (%s)...', self.symbol)
 
-        # Get most current date with price data.
-        most_current_date_price = self.get_most_current_price()
-        most_current_date = most_current_date_price[0]
-        most_current_price = most_current_date_price[1]
+        difference = self._get_performance()['year']
+
+        log.debug('Year performance (fund: %s, performance: %s) complete.',
+                  self.symbol, difference)
 
-        # Find the year before the latest price.
-        day_before = most_current_date - timedelta(weeks=52)
+        return difference
 
-        # Get the closest date with date and price data before the most_current_date.
-        day_before_date_price = self.get_most_current_price(day_before)
-        day_before_price = day_before_date_price[1]
+    def _get_performance(self):
+        """Get day, week and year performance, calculating them on first request.
 
-        # Calculate percentage difference in prices.
-        difference = calculate_percentage(day_before_price, most_current_price)
+        The most current price is found once and shared by all three periods, and the
+        percentages are calculated together by calculate_percentages().
 
-        log.debug(f'Year performance ('
-                  f'fund: {self.__repr__()}, performance: {difference})'
-                  f' complete.')
+        Args:
+            None
 
-        return difference
+        Returns:
+            self._performance (dict): Difference in closing fund price keyed by
+                'day', 'week' and 'year'.
+        """
+
+        if self._performance:
+            return self._performance
+
+        # Get most current date with price data.
+        most_current_date, most_current_price = self.get_most_current_price()
+
+        # Get the closest dates with date and price data before the day, week and
+        # year before the latest date.
+        get_price = self.get_most_current_price
+        day_before_price = get_price(self.dates[-1] - _ONE_DAY)[1]
+        week_before_price = get_price(most_current_date - _ONE_WEEK)[1]
+        year_before_price = get_price(most_current_date - _ONE_YEAR)[1]
+
+        # Calculate percentage differences in prices. Day performance compares the
+        # prices in the opposite order to week and year performance.
+        self._performance = dict(zip(
+            ('day', 'week', 'year'),
+            calculate_percentages(
+                (most_current_price, week_before_price, year_before_price),
+                (day_before_price, most_current_price, most_current_price)
+            )
+        ))
+
+        return self._performance
 
     def get_most_current_price(self, search_date=None):
         """Get most current price for a Fund.
@@ -490,88 +562,92 @@ class Fund:
         Returns:
             tuple(most_current_date, most_current_price): The most current date and
                 price information available.
+
+        Raises:
+            CoreError: When no price is available on or before search_date.
         """
 
-        log.debug(f'Get most current price: ({self.__repr__()})...')
+        log.debug('Get most current price: (%s)...', self.symbol)
 
-        # Use latest date in fund as a default.
+        # Use latest date in fund as a default, which is the last index and needs no
+        # search.
         if search_date is None:
-            search_date = self.dates_prices[-1][0]
+            index = len(self.dates) - 1
+        else:
+            # The bisect module provides O(log(N)) searching.
+            # Identify index of the last date on or before search_date. When the fund
+            # has no earlier date, such as the year before a fund less than a year
+            # old, its first date is used.
+            index = max(bisect.bisect_right(self.dates, search_date) - 1, 0)
 
-        # The bisect module provides O(log(N)) searching.
-        # Identify index of search_date.
-        index = bisect.bisect_left(
-            self.dates_prices,  # List[list[date, price]]
-            search_date,
-            key=(lambda dp: dp[0]))  # Position for date within inner lists.
-
-        # TODO (GS): Check this over.
         # Get date and price data for search_date argument.
         # Revert to previous day if price data has not been updated.
-        most_current_price = None
-        while most_current_price is None:
-            most_current_date, most_current_price = \
-                self.dates_prices[index][0], self.dates_prices[index][1] or None
+        while index >= 0 and math.isnan(self.prices[index]):
             index -= 1
 
-        log.debug(f'Get most current price ({self.__repr__()}, '
-                  f'price: {most_current_price}, date: {most_current_date}) complete. ')
+        if index < 0:
+            msg = f'No price information available for {self.symbol}.'
+            log.warning(msg)
+            raise CoreError(msg)
+
+        most_current_date, most_current_price = self.dates[index], self.prices[index]
+
+        log.debug('Get most current price (%s, price: %s, date: %s) complete. ',
+                  self.symbol, most_current_price, most_current_date)
 
         return most_current_date, most_current_price
 
     def get_closest_dates(self, start_date, end_date):
         """Finds the closest valid dates on or before argument dates.
 
-         Will view a date as invalid if it is after the argument date or if it contains
-         pricing information of None.
+        Will view a date as invalid if it is after the argument date or if it contains
+        pricing information of None. The fund is not changed, so the method is safe to
+        call repeatedly and from several threads.
 
-         Args:
-             start_date (datetime obj): Second parameter. Ideal starting date.
-             end_date (datetime obj): Third parameter. Ideal ending date.
+        Args:
+            start_date (datetime obj): First parameter. Ideal starting date.
+            end_date (datetime obj): Second parameter. Ideal ending date.
 
-         Returns:
-             dates_prices (list[date(str), price(str)]): List of dates and associated
+        Returns:
+            dates_prices (list[[date, float]]): New list of dates and associated
                 prices where the first and last items best fit the start_date and
                 end_date arguments respectively.
-         """
-
-        log.debug(f'Finding closest dates for start date ({start_date.__str__()}), and '
-                  f'end date ({end_date.__str__()})...')
 
-        # Find an end date on or before the requested end date that has both date and
-        # price information.
-        end_found = False
-        while not end_found:
-            if self.dates_prices[-1][0] > end_date:
-                self.dates_prices.pop()
-                continue
-            elif self.dates_prices[-1][1] is None:
-                self.dates_prices.pop()
-            else:
-                end_found = True
-
-        # Find a start date on or before the requested start date that has both date and
-        # price information.
+        Raises:
+            CoreError: When no price is available on or before end_date.
+        """
 
-        # Find index of start date in dates_prices or closest dates before is start date
-        # does not exist.
-        start_index = 0
-        while self.dates_prices[start_index][0] < start_date:
-            start_index += 1
+        log.debug('Finding closest dates for start date (%s), and end date (%s)...',
+                  start_date, end_date)
 
-        start_found = False
-        while not start_found:
-            if self.dates_prices[start_index][1] is None:
-                start_index -= 1
-            else:
-                start_found = True
+        # Find an end date on or before the requested end date that has both date and
+        # price information. end_index is one past the end date.
+        end_index = bisect.bisect_right(self.dates, end_date)
+        while end_index > 0 and math.isnan(self.prices[end_index - 1]):
+            end_index -= 1
+
+        # Find index of start date, or the closest date after it when start date does
+        # not exist, then step back to a date with price information. The start is
+        # kept within the end date so that the result is never empty.
+        start_index = min(bisect.bisect_left(self.dates, start_date), end_index - 1)
+        while start_index >= 0 and math.isnan(self.prices[start_index]):
+            start_index -= 1
+
+        if start_index < 0:
+            msg = f'No price information available for {self.symbol} on or before ' \
+                  f'{end_date}.'
+            log.warning(msg)
+            raise CoreError(msg)
 
         # Eliminate dates outside desired ranges as they are unneeded.
-        dates_prices = self.dates_prices[start_index:]
+        dates_prices = [
+            [d, None if math.isnan(p) else p] for d, p in
+            zip(self.dates[start_index:end_index], self.prices[start_index:end_index])
+        ]
 
-        log.debug(f'Closest date to start date ({start_date.__str__()} --> '
-                  f'{dates_prices[0][0]}), and end date ({end_date.__str__()}, '
-                  f'{dates_prices[-1][0]}) found.')
+        log.debug('Closest date to start date (%s --> %s), and end date (%s, %s) '
+                  'found.',
+                  start_date, dates_prices[0][0], end_date, dates_prices[-1][0])
 
         return dates_prices
 
@@ -586,24 +662,23 @@ class Fund:
             custom_str (str): String displaying performance between argument dates.
         """
 
-        log.debug(f'Generating custom range performance between {start_date} and '
-                  f'{end_date}...')
+        log.debug('Generating custom range performance between %s and %s...',
+                  start_date, end_date)
 
         # Convert dates to datetime objects.
         today = date.today()
-        start_date = datetime.strptime(start_date, DATE_FORMAT).date()
-        end_date = datetime.strptime(end_date, DATE_FORMAT).date()
+        start_date = _parse_date(start_date)
+        end_date = _parse_date(end_date)
 
         # Raise exception if end date is the same or before start date.
         if end_date <= start_date:
-            msg = f'Start date({start_date.__str__()}) must be before end date ' \
-                  f'({end_date.__str__()}).'
+            msg = f'Start date({start_date}) must be before end date ({end_date}).'
             log.warning(msg)
             raise CoreError(msg)
 
         # Raise exception if end date is in the future.
         if end_date > today:
-            msg = f'End date ({end_date.__str__()}) is out of range (in the future).'
+            msg = f'End date ({end_date}) is out of range (in the future).'
             log.warning(msg)
             raise CoreError(msg)
 
@@ -613,15 +688,63 @@ class Fund:
         oldest_price, newest_price = dates_prices[0][1], dates_prices[-1][1]
         difference = calculate_percentage(oldest_price, newest_price)
 
-        custom_str = self.__str__() + '\nPerformance between {} and {}: ' \
+        custom_str = str(self) + '\nPerformance between {} and {}: ' \
                                '{:.2f}%.'.format(start_date, end_date, difference)
 
-        log.debug(f'Custom range performance string between {start_date} and {end_date} '
-                  f'complete.')
+        log.debug('Custom range performance string between %s and %s complete.',
+                  start_date, end_date)
 
         return custom_str
 
 
+def _parse_dates(date_strs):
+    """Convert a sequence of date strings into a tuple of date objects.
+
+    Short lists, such as the default two years of data, are parsed through the date
+    cache in _parse_date(), as funds share the same dates. Long histories are mostly
+    dates not seen before, so they are parsed directly rather than filling, and
+    repeatedly clearing, the cache.
+
+    Args:
+        date_strs (list[str] or tuple[str]): Dates in format yyyy-mm-dd.
+
+    Returns:
+        (tuple[date obj]): Dates represented by argument.
+    """
+
+    if len(date_strs) > BULK_PARSE_THRESHOLD:
+        return tuple(map(date.fromisoformat, date_strs))
+
+    return tuple(map(_parse_date, date_strs))
+
+
+def _parse_date(date_str, _get=_DATE_CACHE.get, _fromisoformat=date.fromisoformat):
+    """Convert a date string into a date object.
+
+    Uses date.fromisoformat(), which parses the fixed yyyy-mm-dd fields in C and is
+    considerably faster than datetime.strptime() or slicing the string in Python.
+    Parsed dates are cached, as funds are usually loaded over the same dates. The cache
+    is emptied once it holds DATE_CACHE_SIZE dates.
+
+    The cache lookup and parser are bound as default arguments, so that each call
+    reads local variables instead of looking up module globals and attributes.
+
+    Args:
+        date_str (str): Date in format yyyy-mm-dd.
+
+    Returns:
+        (date obj): Date represented by argument.
+    """
+
+    parsed = _get(date_str)
+    if parsed is None:
+        if len(_DATE_CACHE) >= DATE_CACHE_SIZE:
+            _DATE_CACHE.clear()
+        parsed = _DATE_CACHE[date_str] = _fromisoformat(date_str)
+
+    return parsed
+
+
 def calculate_percentage(first_price, last_price):
     """Find percentage difference between two numbers. Return is negative
     when first argument is greater than second argument.
@@ -635,21 +758,49 @@ def calculate_percentage(first_price, last_price):
             argument.
     """
 
-    log.debug(f'Calculate percentage (num1: {first_price}, num2: {last_price})...')
+    log.debug('Calculate percentage (num1: %s, num2: %s)...', first_price, last_price)
 
     # Solution as suggested by Chris Kauffman, UMN. Original version worked but does
-    # not look as clean. Can be found in Git history.
+    # not look as clean. Can be found in Git history. The difference is taken
+    # relative to the larger price, and its sign follows from the order of
+    # subtraction.
     first_price, last_price = float(first_price), float(last_price)
-    big, lil = max(first_price, last_price), min(first_price, last_price)
-    # Determine if difference is positive or negative.
-    sign = +1 if first_price < last_price else -1
-    difference = (big - lil) / big * 100 * sign
+    big = first_price if first_price > last_price else last_price
+    difference = (last_price - first_price) / big * 100
 
-    log.debug(f'Calculate percentage (percentage: {difference}) complete.')
+    log.debug('Calculate percentage (percentage: %s) complete.', difference)
 
     return difference
 
 
+def calculate_percentages(first_prices, last_prices):
+    """Find percentage differences between pairs of numbers.
+
+    Gives the same results as calculate_percentage() for each pair, calculated in a
+    single pass without logging each pair.
+
+    Args:
+        first_prices (iterable[float]): First parameter.
+        last_prices (iterable[float]): Second parameter. Paired with first_prices by
+            position.
+
+    Returns:
+        differences (list[float]): Percentage difference between each pair. Negative
+            when the first price is greater than the last price.
+    """
+
+    log.debug('Calculate percentages...')
+
+    differences = [
+        (last - first) / (first if first > last else last) * 100
+        for first, last in zip(map(float, first_prices), map(float, last_prices))
+    ]
+
+    log.debug('Calculate percentages (percentages: %s) complete.', differences)
+
+    return differences
+
+
 def core_self_test():
     """Run Unittests on module.
 
@@ -678,17 +829,6 @@ def test():
 if __name__ == '__main__':
 
     # Configure Rotating Log. Only runs when module is called directly.
-    handler = handlers.RotatingFileHandler(
-        filename=DEFAULT_CORE_LOG_FILENAME,
-        maxBytes=100**3,  # 0.953674 Megabytes.
-        backupCount=1
-    )
-    formatter = logging.Formatter(
-        f'[%(asctime)s] - {RUNTIME_ID} - %(levelname)s - [%(name)s:%(lineno)s] - '
-        f'%(message)s'
-    )
-    handler.setFormatter(formatter)
-    log.addHandler(handler)
-    log.setLevel(CORE_LOG_LEVEL)
+    configure_logging(log, DEFAULT_CORE_LOG_FILENAME, CORE_LOG_LEVEL)
 
     core_self_test()
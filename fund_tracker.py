@@ -33,9 +33,9 @@ Extendability:
     
     Adding modules for retrieving data from different sources is easily incorporated. 
     To do so one must include the module in the FundTracker class attribute 
-    self.AVAILABLE_DATA_SOURCES, so that a name for the data sources is the key and a 
-    FundTracker method is the value. A custom method that handles the fund must be 
-    created to pull data from the new module.
+    AVAILABLE_DATA_SOURCES, so that a name for the data sources is the key and the 
+    name of a FundTracker method is the value. A custom method that handles the fund 
+    must be created to pull data from the new module.
     
     The data returned must be a list of data for each fund where:
     
@@ -61,7 +61,8 @@ Attributes:
     DEFAULT_LOG_FILENAME: Default file path for application wide logging.
     DEFAULT_LOG_LEVEL: Default log level.
     DEFAULT_THREAD_TIMEOUT: Number of seconds before the thread should time out.
-    RUNTIME_ID: Generate a unique uuid object. Used in logging.
+    MAX_WORKERS: Maximum number of threads in the thread pool used to instantiate
+        funds.
 
 Composition Attributes:
     Line length = 88 characters.
@@ -70,20 +71,25 @@ TODO:
     Incorporate more robust error and exception handling.    
 """
 
-import argparse
+import atexit
 import logging
+import os
 import sys
 import time
-import uuid
 
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
-from logging import handlers
+from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import date, timedelta
 
 # Local imports.
+from cache import cache_self_test
 from core import core_self_test, Fund
-from customthread import RTV as rtv
-from pull_from_yf import get_yf_fund_data, pull_from_yf_self_test
+from log_config import configure_logging
+from pull_from_yf import \
+    disable_cache, \
+    get_yf_fund_data, \
+    get_yf_funds_data, \
+    pull_from_yf_self_test
 from storage import Repo, storage_self_test
 
 
@@ -93,12 +99,21 @@ DEFAULT_DATA_SOURCE = 'yahoofinance'
 DEFAULT_LOG_FILENAME = 'fund_tracker.log'
 DEFAULT_LOG_LEVEL = logging.DEBUG
 DEFAULT_THREAD_TIMER = 0.8  # In seconds.
-RUNTIME_ID = uuid.uuid4()
+MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
 
 # Configure logging.
 log = logging.getLogger()
 log.addHandler(logging.NullHandler())
 
+# Thread pool shared by all calls to FundTracker.instantiate_saved_funds() and
+# FundTracker.instantiate_fund(), so that threads are reused rather than started for
+# each fund. Work submitted here never waits on this pool itself.
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='fund')
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+# Separator following the performance of each fund.
+_FUND_SEPARATOR = '*' * 100
+
 
 class FundTrackerApplicationError(RuntimeError):
     """Base class for exceptions arising from this module."""
@@ -108,37 +123,69 @@ class FundTracker:
     """Application for tracking and displaying stock market data.
 
     Class level parameters:
-        self.AVAILABLE_DATA_SOURCES (dict['name': class method]):
-            Dictionary containing names and associated class methods for linked external
-            modules for retrieving fund data. Must be update when adding external data
-            retrieval modules.
+        AVAILABLE_DATA_SOURCES (dict['name': 'method name']):
+            Dictionary containing names and the names of associated class methods for
+            linked external modules for retrieving fund data. Must be update when adding
+            external data retrieval modules.
+        AVAILABLE_BATCH_DATA_SOURCES (dict['name': 'method name']):
+            Dictionary containing names and the names of associated class methods for
+            data sources which can retrieve data for many funds in a single call. Used
+            by self.instantiate_saved_funds() in place of one call per fund.
 
     Args:
         load_data (bool): Defaults to True. True loads saved data when available.
         data_file (str): Defaults to data.csv. File name to save and load data.
         data_source (str): Defaults to yahoofinance. Module from which to load fund
             data.
+        instantiate_funds (bool): Defaults to True. When False saved funds are not
+            instantiated, so no fund data is retrieved. Saved funds can still be added
+            and deleted.
     """
 
+    # Methods are named rather than bound, so these are shared by every instance and
+    # methods are looked up on the instance when called.
+    AVAILABLE_DATA_SOURCES = {'yahoofinance': 'pull_yahoofinancial'}
+    AVAILABLE_BATCH_DATA_SOURCES = {'yahoofinance': 'pull_yahoofinancial_batch'}
+
     def __init__(self,
                  load_data=True,
                  data_file=DEFAULT_DATA_FILE,
-                 data_source=DEFAULT_DATA_SOURCE
+                 data_source=DEFAULT_DATA_SOURCE,
+                 instantiate_funds=True
                  ):
 
-        self.AVAILABLE_DATA_SOURCES = {'yahoofinance': self.pull_yahoofinancial}
-
         self.repo = Repo(load_data=load_data, data_file=data_file)
         self.symbols_names = self.repo.symbols_names  # ex: ['F', 'FXAIX']
-        self.funds = self.instantiate_saved_funds(data_source)  # [Fund objects]
+        if instantiate_funds:
+            self.funds = self.instantiate_saved_funds(data_source)  # [Fund objects]
+        else:
+            self.funds = []
+
+    @property
+    def funds(self):
+        """list[Fund]: Instantiated funds, in the order they were added."""
+
+        return self._funds
+
+    @funds.setter
+    def funds(self, funds):
+        # Index funds by symbol so find_fund() does not scan the list. The first fund
+        # with a symbol is indexed, matching the order of the list.
+        self._funds = funds
+        self._funds_by_symbol = {}
+        for fund in funds:
+            if fund is not None:
+                self._funds_by_symbol.setdefault(fund.symbol, fund)
 
     def instantiate_saved_funds(self, data_source=DEFAULT_DATA_SOURCE):
         """Generate a list of Fund objects based on saved data.
 
         data_source indicates which application to use when getting fund data.
 
-        Multithreading incorporated due to much of the processing time spent waiting
-        on IO bound operations, such as waiting on network sockets.
+        When data_source has a batch method in self.AVAILABLE_BATCH_DATA_SOURCES, data
+        for every fund is retrieved with a single call. Otherwise multithreading is
+        incorporated due to much of the processing time spent waiting on IO bound
+        operations, such as waiting on network sockets.
 
         Args:
             data_source (str): OPTIONAL. Uses a default data source when argument is
@@ -148,32 +195,72 @@ class FundTracker:
             instantiated_funds ([fund obj]): List of Fund objects.
         """
 
-        log.debug(f'Instantiate saved funds. Data source: {data_source}...')
+        log.debug('Instantiate saved funds. Data source: %s...', data_source)
 
         start_time = time.perf_counter()  # Time operation.
 
-        # Use custom thread class (rtv) to get return values from called method.
-        # Construct list of thread objects.
-        threads = [rtv(target=self.instantiate_fund,
-                       args=[s_n[0], s_n[1], data_source, False])
-                   for s_n in self.symbols_names]
-
-        # Kill and cleanup threads that may run past thread.join. Threads may do this
-        # when there is a bad network connection, dependant modules are slow to respond
-        # or user inputs are bad.
-        for thread in threads:
-            thread.daemon = True
-
-        # Execute threads.
-        [thread.start() for thread in threads]
-
-        # Collect results.
-        instantiated_funds = [thread.join(DEFAULT_THREAD_TIMER) for thread in threads]
+        if not self.symbols_names:
+            return []
+
+        batch_method_name = self.AVAILABLE_BATCH_DATA_SOURCES.get(data_source)
+        if batch_method_name is not None:
+            batch_method = getattr(self, batch_method_name)
+            funds_data = batch_method([s_n[0] for s_n in self.symbols_names])
+
+            # Data is None for a fund which could not be retrieved.
+            instantiated_funds = []
+            for s_n, data in zip(self.symbols_names, funds_data):
+                if data is None:
+                    log.warning('Instantiate fund (%s) failed.', s_n[0])
+                    instantiated_funds.append(None)
+                    continue
+                instantiated_funds.append(Fund.from_data(data, name=s_n[1]))
+
+            log.debug('Instantiate saved funds completed in %.2f seconds.',
+                      time.perf_counter() - start_time)
+
+            return instantiated_funds
+
+        # Submit each fund to the thread pool. The futures carry the return values
+        # from the called method. Each fund already runs in a pool thread, so
+        # instantiate_fund does not need to create its own.
+        futures = [
+            _EXECUTOR.submit(
+                self.instantiate_fund,
+                s_n[0],
+                s_n[1],
+                data_source,
+                _create_thread=False
+            )
+            for s_n in self.symbols_names
+        ]
+
+        # Wait for every fund at once, so all funds share a single timeout rather than
+        # each slow fund adding its own. Funds still running are cancelled if they
+        # have not started.
+        done, not_done = wait(futures, timeout=DEFAULT_THREAD_TIMER)
+        for future in not_done:
+            future.cancel()
+
+        # Collect results. Funds may not be returned when there is a bad network
+        # connection, dependant modules are slow to respond or user inputs are bad.
+        instantiated_funds = []
+        for s_n, future in zip(self.symbols_names, futures):
+            if future not in done:
+                log.warning('Instantiate fund (%s) timed out.', s_n[0])
+                instantiated_funds.append(None)
+            elif future.exception() is not None:
+                log.warning('Instantiate fund (%s) failed: %s', s_n[0],
+                            future.exception())
+                instantiated_funds.append(None)
+            else:
+                instantiated_funds.append(future.result())
 
         end_time = time.perf_counter()
-        total_time = round(end_time - start_time, 2)
 
-        log.debug(f'Instantiate saved funds completed in {total_time} seconds.')
+        # Rounded by the format only when the record is emitted.
+        log.debug('Instantiate saved funds completed in %.2f seconds.',
+                  end_time - start_time)
 
         return instantiated_funds
 
@@ -206,31 +293,35 @@ class FundTracker:
             matching the symbol parameter. None otherwise.
         """
 
-        log.debug(f'Instantiate fund using symbol: {symbol}, name: {name}, '
-                  f'data_source: {data_source}...')
+        log.debug('Instantiate fund using symbol: %s, name: %s, data_source: %s...',
+                  symbol, name, data_source)
 
         # Will raise exception if data_source is not legal.
         self.check_data_source(data_source)
 
         # Identify method connecting to external module for pulling data.
-        source_method = self.AVAILABLE_DATA_SOURCES[data_source]
+        source_method = getattr(self, self.AVAILABLE_DATA_SOURCES[data_source])
 
         # Threading used to set max time for operation.
         if _create_thread is True:
-            log.debug(f'Creating thread for {symbol}...')
+            log.debug('Submitting %s to thread pool...', symbol)
 
-            thread = rtv(target=source_method, args=[symbol, start_date, end_date])
-            thread.daemon = True  # Cleanup threads that may run past thread.join.
-            thread.start()
-            data = thread.join(DEFAULT_THREAD_TIMER)
+            # The future carries the return value of source_method back from the pool
+            # thread, which is reused rather than started for this fund.
+            future = _EXECUTOR.submit(source_method, symbol, start_date, end_date)
 
-            if thread.is_alive():
-                msg = f'Thread {thread.thread_name} timed out. Fund symbol might be ' \
-                      f'invalid.'
+            try:
+                data = future.result(DEFAULT_THREAD_TIMER)
+            except FutureTimeoutError:
+                msg = f'Thread for {symbol} timed out. Fund symbol might be invalid.'
                 log.warning(msg)
                 raise FundTrackerApplicationError(msg)
+            except Exception as e:
+                # Matches a failed thread, which returns no data.
+                log.warning('Thread for %s failed: %s', symbol, e)
+                data = None
 
-            log.debug(f'Thread for {symbol} completed.')
+            log.debug('Thread for %s completed.', symbol)
 
         # When method is called by self.instantiate_saved_funds(), since that method
         # already incorporates threading.
@@ -242,11 +333,9 @@ class FundTracker:
         if data is None:
             return None
 
-        if name:  # Add optional name parameter string.
-            data.append(name)
-        fund = Fund(*data)  # Instantiate fund object.
+        fund = Fund.from_data(data, name=name)  # Instantiate fund object.
 
-        log.debug(f'Instantiate fund ({fund}) complete.')
+        log.debug('Instantiate fund (%s) complete.', fund.symbol)
 
         return fund
 
@@ -265,14 +354,14 @@ class FundTracker:
                 FundTrackerApplicationError otherwise.
         """
 
-        log.debug(f'Check legality of data source: {data_source}...')
+        log.debug('Check legality of data source: %s...', data_source)
 
         if data_source in self.AVAILABLE_DATA_SOURCES:
-            log.debug(f'Data source: {data_source} is legal.')
+            log.debug('Data source: %s is legal.', data_source)
             return True
         else:
             msg = f'Data source not available. Available data sources: ' \
-                  f'{self.AVAILABLE_DATA_SOURCES}.'
+                  f'{list(self.AVAILABLE_DATA_SOURCES)}.'
             log.warning(msg)
             raise FundTrackerApplicationError(msg)
 
@@ -296,7 +385,7 @@ class FundTracker:
                 List of fund data.
         """
 
-        log.debug(f'Pulling data for fund ({symbol}) from yahoofinancial...')
+        log.debug('Pulling data for fund (%s) from yahoofinancial...', symbol)
 
         # None because second argument in get_yf_fund_data() is optional name which is
         # not currently being used.
@@ -309,18 +398,44 @@ class FundTracker:
         # Pull data from yahoofinancial.
         data = get_yf_fund_data(*args)
 
-        log.debug(f'Pulling data for fund ({symbol}) from yahoofinancial complete.')
+        log.debug('Pulling data for fund (%s) from yahoofinancial complete.', symbol)
 
         return data
 
+    def pull_yahoofinancial_batch(self, symbols):
+        """Get data for many funds from yahoofinancial module with a single call.
+
+        Data is retrieved for the default date range.
+
+        Args:
+            symbols (list[str]): Symbols of funds on which to pull data. Ex: ['FXAIX'].
+
+        Returns:
+            funds_data (list[list[symbol, denomination, type, list[[date, price]]]]):
+                List of fund data in the same order as symbols. None in place of a
+                fund which could not be retrieved.
+        """
+
+        log.debug('Pulling data for %s funds from yahoofinancial...', len(symbols))
+
+        funds_data = get_yf_funds_data(symbols)
+
+        log.debug('Pulling data for %s funds from yahoofinancial complete.',
+                  len(symbols))
+
+        return funds_data
+
     def save(self, data=None, data_file=False):
         """Saves data.
 
         Must be .csv file type. Saves fund symbol and name if name is populated.
 
         Args:
-            data (None or list[Fund]): First parameter. Defaults to None. Saves
-                data from self.funds when None, saves supplied list data otherwise.
+            data (None or list[Fund] or list['symbol', 'name']): First parameter.
+                Defaults to None. Saves self.symbols_names when None, saves supplied
+                list data otherwise. self.symbols_names is kept up to date by
+                self.add_fund() and self.delete_fund(), and includes funds which were
+                not instantiated.
             data_file (str or False): Second parameter. OPTIONAL. String representing a
                 file name to save data. '.csv' is the only supported file type. Will
                 create new file with that name if one does not exist. If False, will use
@@ -337,7 +452,7 @@ class FundTracker:
 
         # Check for unique data.
         if not data:
-            data = self.funds
+            data = self.symbols_names
         self.repo.save(data, data_file)
 
     def find_fund(self, symbol):
@@ -350,16 +465,23 @@ class FundTracker:
             fund (Fund or None): Fund object if found, None otherwise.
         """
 
-        log.debug(f'Find fund ({symbol})...')
+        log.debug('Find fund (%s)...', symbol)
 
-        for existing_fund in self.funds:
-            if existing_fund == symbol:
-                fund = existing_fund
-                return fund
+        return self._funds_by_symbol.get(symbol)
 
-        log.debug(f'Find fund ({symbol}) complete.')
+    def is_saved(self, symbol):
+        """Check whether a fund is saved, including one which was not instantiated.
 
-        return None
+        Args:
+            symbol (str): Symbol representing a fund.
+
+        Returns:
+            (bool): True if the fund is in the saved data, False otherwise.
+        """
+
+        log.debug('Is saved (%s)...', symbol)
+
+        return any(s_n[0] == symbol for s_n in self.symbols_names)
 
     def delete_fund(self, symbol):
         """Delete indicated fund.
@@ -368,20 +490,34 @@ class FundTracker:
             symbol (str): String representation of fund to delete.
 
         Returns:
-            success (Fund or False): Fund if successful, False otherwise.
+            success (Fund or bool): Fund if successful, True if successful for a fund
+                which was saved but not instantiated, False otherwise.
         """
 
-        log.debug(f'Delete fund ({symbol})...')
+        log.debug('Delete fund (%s)...', symbol)
+
+        # Remove fund from saved data.
+        saved = False
+        for s_n in self.symbols_names:
+            if s_n[0] == symbol:
+                self.symbols_names.remove(s_n)
+                saved = True
+                break
 
         # Find fund.
         fund = self.find_fund(symbol)
         if fund is None:
-            return False
+            return saved
 
-        # Remove fund from self.funds.
-        self.funds.remove(fund)
+        # Remove fund from self.funds, then index any remaining fund with the symbol.
+        self._funds.remove(fund)
+        del self._funds_by_symbol[symbol]
+        for existing_fund in self._funds:
+            if existing_fund == symbol:
+                self._funds_by_symbol[symbol] = existing_fund
+                break
 
-        log.debug(f'Delete fund  ({symbol}) complete.')
+        log.debug('Delete fund  (%s) complete.', symbol)
 
         return fund
 
@@ -404,20 +540,19 @@ class FundTracker:
 
         log.debug('Generate all fund perf str...')
 
-        all_performance = ''
+        # Collect the performance of each fund and its separator, then join them once.
+        parts = []
         kvargs = day, week, year
         for fund in self.funds:
             try:
-                all_performance += '\n' + fund.generate_fund_performance_str(*kvargs)
-                all_performance += '\n' + '*' * 100
-            except AttributeError as ae:
+                parts.append(fund.generate_fund_performance_str(*kvargs))
+            except AttributeError:
                 # Can occur upon thread timeout, or lag from dependant modules over
-                # network that cannot locate a fund.
-                msg = f'Fund: {fund} returned as None. Possible thread timeout.'
-                log.warning(msg)
-                raise FundTrackerApplicationError(msg)
-            finally:
+                # network that cannot locate a fund. The fund is skipped.
+                log.warning('Fund: %s returned as None. Possible thread timeout.', fund)
                 continue
+            parts.append(_FUND_SEPARATOR)
+        all_performance = '\n' + '\n'.join(parts) if parts else ''
 
         log.debug('Generate all fund perf str complete.')
 
@@ -442,21 +577,21 @@ class FundTracker:
             )
         """
 
-        log.debug(f'Custom range performance ({symbol})...')
+        log.debug('Custom range performance (%s)...', symbol)
 
         # Convert date arguments to datetime objects.
-        start_date = datetime.strptime(start_date, DATE_FORMAT).date()
-        end_date = datetime.strptime(end_date, DATE_FORMAT).date()
+        start_date = date.fromisoformat(start_date)
+        end_date = date.fromisoformat(end_date)
 
         # Include an additional week before the start date to make up for dates where
         # pricing and/or dates are not available.
-        start_plus_week = start_date - relativedelta(weeks=1)
+        start_plus_week = start_date - timedelta(weeks=1)
 
         fund = self.instantiate_fund(
             symbol,
             data_source=DEFAULT_DATA_SOURCE,
-            start_date=start_plus_week.__str__(),
-            end_date=end_date.__str__()
+            start_date=start_plus_week.isoformat(),
+            end_date=end_date.isoformat()
         )
 
         if fund is None:
@@ -465,11 +600,11 @@ class FundTracker:
             raise FundTrackerApplicationError(msg)
 
         custom_str = fund.get_custom_range_performance(
-            start_date.__str__(),
-            end_date.__str__()
+            start_date.isoformat(),
+            end_date.isoformat()
         )
 
-        log.debug(f'Custom range performance ({symbol}) complete.')
+        log.debug('Custom range performance (%s) complete.', symbol)
 
         return custom_str
 
@@ -486,15 +621,18 @@ class FundTracker:
             fund (True): True if successful, False otherwise.
         """
 
-        log.debug(f'Add fund using symbol: {symbol}, name: {name}...')
+        log.debug('Add fund using symbol: %s, name: %s...', symbol, name)
 
         # Instantiate Fund object.
         fund = self.instantiate_fund(symbol=symbol.upper(), name=name)
 
-        # Add fund to list of funds.
-        self.funds.append(fund)
+        # Add fund to list of funds, and to saved data when it was found.
+        self._funds.append(fund)
+        if fund is not None:
+            self._funds_by_symbol.setdefault(fund.symbol, fund)
+            self.symbols_names.append([fund.symbol, name])
 
-        log.debug(f'Add fund ({fund}) complete.')
+        log.debug('Add fund (%s) complete.', symbol)
 
         return fund
 
@@ -546,6 +684,9 @@ def interactive():
 def parse_args(argv=sys.argv):
     """Setup shell environment to run program."""
 
+    # Only needed when run from the command line, so not imported with the module.
+    import argparse
+
     log.debug('Parse_args...')
 
     # Program description.
@@ -606,9 +747,17 @@ def parse_args(argv=sys.argv):
         default=False
     )
 
+    parser.add_argument(
+        '-nc',
+        '--no-cache',
+        help='Retrieve all fund data over the network without using saved prices.',
+        action='store_true',
+        default=False
+    )
+
     args = parser.parse_args()  # Collect arguments.
 
-    log.debug(f'Parse_args complete. Args: {args}')
+    log.debug('Parse_args complete. Args: %s', args)
 
     return args
 
@@ -625,19 +774,25 @@ def run_application(args):
 
     log.debug('Run application...')
 
+    if args.no_cache:
+        disable_cache()
+
     # Skip instantiating Application if self testing is selected.
     if args.test:
         self_test()
         pull_from_yf_self_test()
         storage_self_test()
         core_self_test()
+        cache_self_test()
         return
 
     elif args.interactive:
         interactive()
         return
 
-    ft = FundTracker()  # Begin application instance.
+    # Adding and deleting only change saved data, so saved funds are not instantiated.
+    offline = not args.getall and (args.add[0] is not None or bool(args.delete))
+    ft = FundTracker(instantiate_funds=not offline)  # Begin application instance.
 
     if args.getall:
         funds = ft.generate_all_fund_perf_str()
@@ -698,18 +853,7 @@ def test():
     
 def main():
     # Configure Rotating Log.
-    handler = handlers.RotatingFileHandler(
-        filename=DEFAULT_LOG_FILENAME,
-        maxBytes=100 ** 3,  # 0.953674 Megabytes.
-        backupCount=1
-    )
-    formatter = logging.Formatter(
-        f'[%(asctime)s] - {RUNTIME_ID} - %(levelname)s - [%(name)s:%(lineno)s] - '
-        f'%(message)s'
-    )
-    handler.setFormatter(formatter)
-    log.addHandler(handler)
-    log.setLevel(DEFAULT_LOG_LEVEL)
+    configure_logging(log, DEFAULT_LOG_FILENAME, DEFAULT_LOG_LEVEL)
 
     log.debug('main...')
 
@@ -719,9 +863,8 @@ def main():
     run_application(args)
 
     end_time = time.perf_counter()  # Set end time for timing operations.
-    total_time = round(end_time - start_time, 2)
 
-    log.debug(f'main completed in {total_time} seconds.')
+    log.debug('main completed in %.2f seconds.', end_time - start_time)
 
 
 if __name__ == '__main__':
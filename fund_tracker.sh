@@ -3,5 +3,6 @@
 # Activate virtual environment.
 source ./venv/bin/activate
 
-# Run program in interactive mode.
-python fund_tracker.py -i
+# Run program in interactive mode. Set PYTHON to use another interpreter, such as
+# PYTHON=pypy3.
+${PYTHON:-python} fund_tracker.py -i
@@ -20,8 +20,7 @@ Action sequence:
         <---> _get_user_inputs
                 <---> _add    --> _find
                         <---------'
-                <---> _delete --> _find
-                        <---------'
+                <---> _delete
                 <---> _invalid
                 <---> _menu
                 <---> _show all
@@ -31,7 +30,6 @@ Action sequence:
 Attributes:
     DEFAULT_LOG_FILENAME: Default filename for logging when module called directly.
     DEFAULT_LOG_LEVEL: Default log level when this module is called directly.
-    RUNTIME_ID: Generate a unique uuid object. Used in logging.
 
 Composition Attributes:
     Line length = 88 characters.
@@ -39,15 +37,13 @@ Composition Attributes:
 """
 
 import logging
-import uuid
-from logging import handlers
 
 # Local imports.
 from fund_tracker import FundTracker
+from log_config import configure_logging
 
 DEFAULT_LOG_FILENAME = 'customthread.log'
 DEFAULT_LOG_LEVEL = logging.WARNING
-RUNTIME_ID = uuid.uuid4()
 
 
 # Configure logging.
@@ -171,10 +167,9 @@ class Interactive:
 
         if not self._find(symbol):
 
-            fund = self.ft.instantiate_fund(symbol, name)
-            self.ft.funds.append(fund)
+            fund = self.ft.add_fund(symbol, name)
 
-            if fund in self.ft.funds:
+            if fund is not None:
                 print(f'{symbol} has been added.')
             else:
                 print(f'Unable to add {symbol}.')
@@ -200,8 +195,8 @@ class Interactive:
         symbol = input('Enter the symbol of fund to delete: ')
         symbol = symbol.upper().strip()
 
-        if self._find(symbol):
-            self.ft.delete_fund(symbol)
+        # Funds which were saved but not instantiated are deleted too.
+        if self.ft.delete_fund(symbol):
             print(f'Fund {symbol} has been deleted.')
             return
 
@@ -228,21 +223,22 @@ class Interactive:
     def _find(self, symbol):
         """Check for existence of fund.
 
+        Saved funds are found even when their data could not be retrieved this run.
+
         Args:
             symbol (str): Symbol for fund.
 
         Returns:
-            Bool: True if fund is located within FundTracker, False otherwise.
+            Bool: True if fund is saved within FundTracker, False otherwise.
         """
 
-        log.debug(f'Checking for existence of fund: {symbol}...')
+        log.debug('Checking for existence of fund: %s...', symbol)
 
-        for fund in self.ft.funds:
-            if fund.symbol == symbol:
-                log.debug(f'Fund: {symbol} found.')
-                return True
+        if self.ft.is_saved(symbol):
+            log.debug('Fund: %s found.', symbol)
+            return True
 
-        log.debug(f'Fund: {symbol} not found.')
+        log.debug('Fund: %s not found.', symbol)
         return False
 
     def _invalid(self):
@@ -351,17 +347,6 @@ def self_test():
 if __name__ == '__main__':
 
     # Configure Rotating Log. Only runs when module is called directly.
-    handler = handlers.RotatingFileHandler(
-        filename=DEFAULT_LOG_FILENAME,
-        maxBytes=100 ** 3,  # 0.953674 Megabytes.
-        backupCount=1
-    )
-    formatter = logging.Formatter(
-        f'[%(asctime)s] - {RUNTIME_ID} - %(levelname)s - [%(name)s:%(lineno)s] - '
-        f'%(message)s'
-    )
-    handler.setFormatter(formatter)
-    log.addHandler(handler)
-    log.setLevel(DEFAULT_LOG_LEVEL)
+    configure_logging(log, DEFAULT_LOG_FILENAME, DEFAULT_LOG_LEVEL)
 
     self_test()
@@ -0,0 +1,105 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+Author:
+    Graham Steeds
+
+Context:
+    This module provides logging configuration shared by every Fund Tracker module.
+
+Description:
+    Every record written by a single run of Fund Tracker is tagged with the same
+    runtime id, so that records from one run can be found in a log file shared with
+    other runs.
+
+    configure_logging() writes records to a rotating log file. Records are buffered
+    and written from a background thread so that logging does not block on file
+    writes. Warnings and errors are written immediately.
+
+Attributes:
+    LOG_BUFFER_CAPACITY: Number of records buffered before they are written to file.
+    LOG_FILE_BACKUP_COUNT: Number of rotated log files kept.
+    LOG_FILE_MAX_BYTES: Size at which a log file is rotated.
+    RUNTIME_ID: Unique id for this run, generated on first use by runtime_id(). Used
+        in logging.
+
+Composition Attributes:
+    Line length = 88 characters.
+"""
+
+import atexit
+import logging
+import queue
+import uuid
+from logging import handlers
+
+
+LOG_BUFFER_CAPACITY = 1024
+LOG_FILE_BACKUP_COUNT = 5
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024  # 10 Mebibytes.
+RUNTIME_ID = None
+
+
+def configure_logging(logger, filename, level):
+    """Write records from logger to a rotating log file.
+
+    Args:
+        logger (logging.Logger): First parameter. Logger to configure.
+        filename (str): Second parameter. Filename for the log file.
+        level (int): Third parameter. Log level for logger.
+
+    Returns:
+        listener (logging.handlers.QueueListener): Listener writing records to file.
+            Stopped when the interpreter exits.
+    """
+
+    handler = handlers.RotatingFileHandler(
+        filename=filename,
+        maxBytes=LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUP_COUNT,
+        delay=True  # Open file on first record.
+    )
+    formatter = logging.Formatter(
+        f'[%(asctime)s] - {runtime_id()} - %(levelname)s - [%(name)s:%(lineno)s] - '
+        f'%(message)s'
+    )
+    handler.setFormatter(formatter)
+    # Buffer records and write them to file from a background thread so that logging
+    # does not block on file writes.
+    buffered_handler = handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=handler,
+        flushOnClose=True
+    )
+    log_queue = queue.Queue(-1)
+    listener = handlers.QueueListener(
+        log_queue,
+        buffered_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+
+    return listener
+
+
+def runtime_id():
+    """Get the unique id for this run, generating it on first use.
+
+    Args:
+        None
+
+    Returns:
+        RUNTIME_ID (str): Hex string of a uuid4.
+    """
+
+    global RUNTIME_ID
+
+    if RUNTIME_ID is None:
+        RUNTIME_ID = uuid.uuid4().hex
+
+    return RUNTIME_ID
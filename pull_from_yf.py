@@ -18,58 +18,171 @@ Description:
     coordinate with other functions to return desired data in the form of:
         list[symbol, denomination, type, list[[date, price]], name]
 
+    Repeated requests for the same fund and dates within a run are answered from an
+    in-process cache. Retrieved data is also stored in an on-disk cache (see cache.py)
+    which persists between runs. Requests are answered from the on-disk cache when the
+    requested dates have already been retrieved, and requests that miss the cache are
+    expanded to whole weeks so that later requests are more likely to be covered.
+    disable_cache() stops the on-disk cache from being read or written for the rest of
+    the run.
+
+    When data for several funds is needed at once get_yf_funds_data() submits every
+    request to a shared thread pool and returns the results in order of the symbols.
+    Asynchronous callers may await aget_yf_fund_data() instead.
+
 Attributes:
     DATE_FORMAT: Format for working with dates. (yyyy-mm-dd).
+    DEFAULT_FETCH_STRATEGY: Default strategy for retrieving data. See FETCH_STRATEGIES.
     DEFAULT_LOG_FILENAME: Default filename for logging when module called directly.
     DEFAULT_LOG_LEVEL: Default log level when this module is called directly.
+    DEFAULT_THREAD_TIMEOUT: Number of seconds before a data request should time out.
     MAX_CHARACTER_LEN: Maximum amount of characters for a fund string.
     MIN_CHARACTER_LEN: Minimum amount of characters for a fund string.
-    RUNTIME_ID: Generate a unique uuid object. Used in logging.
-    CURRENT_DATE: String representing the current date in yyyy-mm-dd format.
-    WEEK_AGO_DATE: String representing the date a week before the current date in
-        yyyy-mm-dd format. Used when generating default dates data.
-    MONTH_AGO_DATE: String representing the date a month before the current date in
-        yyyy-mm-dd format. Used when generating default dates data.
-    TWO_YEARS_AGO_DATE: String representing the date two years before the current date
-        in yyyy-mm-dd format. Used when generating default dates data.
+    MAX_WORKERS: Maximum number of threads in the shared thread pool.
+    MEMORY_CACHE_SIZE: Maximum number of requests held in the in-process cache.
+    FETCH_STRATEGIES: Maps the name of each strategy for retrieving data to the
+        function which implements it.
+    REQUIRED_FUND_KEYS: Keys which must be present in the data returned for a fund.
+
+Default dates:
+    current_date(), week_ago_date(), month_ago_date() and two_years_ago_date() return
+    strings in yyyy-mm-dd format relative to the current date. They are computed when
+    first needed and recomputed when the date changes, so long running processes do
+    not use stale defaults.
 
 Composition Attributes:
     Line length = 88 characters.
     """
 
+import atexit
+import functools
+import importlib
 import logging
-import uuid
-from datetime import date, datetime
-from dateutil.relativedelta import relativedelta
-from logging import handlers
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import date, datetime, timedelta
+from operator import itemgetter
 
-# Third party imports.
-from yahoofinancials import YahooFinancials
+# Local imports.
+from cache import CacheError, PriceCache
+from log_config import configure_logging
 
 
 DATE_FORMAT = '%Y-%m-%d'
 DEFAULT_LOG_FILENAME = 'pull_data.log'
+DEFAULT_FETCH_STRATEGY = 'pool'
 DEFAULT_LOG_LEVEL = logging.WARNING
+DEFAULT_THREAD_TIMEOUT = 0.8  # In seconds.
 MAX_CHARACTER_LEN = 7
 MIN_CHARACTER_LEN = 0
-RUNTIME_ID = uuid.uuid4()
+MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+MEMORY_CACHE_SIZE = 1024
+
+# Keys used in YahooFinancials data, defined once so that every lookup uses the same
+# spelling.
+_CLOSE = 'close'
+_CURRENCY = 'currency'
+_FORMATTED_DATE = 'formatted_date'
+_INSTRUMENT_TYPE = 'instrumentType'
+_PRICES = 'prices'
+
+REQUIRED_FUND_KEYS = (
+    'firstTradeDate',
+    _CURRENCY,
+    _INSTRUMENT_TYPE,
+    'timeZone',
+    _PRICES
+)
 
-# Date related attributes.
-CURRENT_DATE = date.today().__str__()
-WEEK_AGO_DATE = (date.today() - relativedelta(weeks=1)).__str__()
-MONTH_AGO_DATE = (date.today() - relativedelta(months=1)).__str__()
-TWO_YEARS_AGO_DATE = (date.today() - relativedelta(years=2)).__str__()
+# Extract date and closing price from a price row in C rather than bytecode.
+_DATE_PRICE = itemgetter(_FORMATTED_DATE, _CLOSE)
 
 
 # Configure logging.
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Shared thread pool. Threads are reused between requests instead of being created and
+# destroyed for each fund.
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='yf')
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+# On-disk cache of retrieved data. Opened on first use by _get_cache().
+_CACHE = None
+_CACHE_ENABLED = True
+_CACHE_LOCK = threading.Lock()
+
 
 class PullDataError(RuntimeError):
     """Base class for exceptions arising from this module."""
 
 
+@functools.lru_cache(maxsize=1)
+def _default_dates(today):
+    """Generate default date strings relative to today.
+
+    Cached, so dates are only recomputed when the argument date changes.
+
+    Args:
+        today (date obj): The current date.
+
+    Returns:
+        tuple(current, week_ago, month_ago, two_years_ago): Dates in yyyy-mm-dd format.
+    """
+
+    return (
+        today.isoformat(),
+        (today - timedelta(days=7)).isoformat(),
+        (today - timedelta(days=30)).isoformat(),
+        _years_ago(today, 2).isoformat()
+    )
+
+
+def _years_ago(today, years):
+    """Get the same calendar date a number of years before today.
+
+    Args:
+        today (date obj): First parameter. The current date.
+        years (int): Second parameter. Number of years before today.
+
+    Returns:
+        (date obj): Date years before today. February 28th when today is February 29th
+            and the earlier year is not a leap year.
+    """
+
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:  # February 29th in a year without one.
+        return today.replace(year=today.year - years, day=28)
+
+
+def current_date():
+    """Get the current date in yyyy-mm-dd format."""
+
+    return _default_dates(date.today())[0]
+
+
+def week_ago_date():
+    """Get the date a week before the current date in yyyy-mm-dd format."""
+
+    return _default_dates(date.today())[1]
+
+
+def month_ago_date():
+    """Get the date a month before the current date in yyyy-mm-dd format."""
+
+    return _default_dates(date.today())[2]
+
+
+def two_years_ago_date():
+    """Get the date two years before the current date in yyyy-mm-dd format."""
+
+    return _default_dates(date.today())[3]
+
+
 def _get_fund_data(fund, start_date, end_date):
     """Retrieve data for fund.
 
@@ -83,11 +196,19 @@ def _get_fund_data(fund, start_date, end_date):
     """
 
     log.debug(
-        f'Getting data for fund: {fund}, between {start_date} and {end_date}...')
+        'Getting data for fund: %s, between %s and %s...', fund, start_date, end_date)
 
     # Check legality of fund and dates.
     if _check_dates(start_date, end_date) and _check_symbol(fund):
 
+        # Third party import, deferred until data is retrieved over the network.
+        # Usually already imported by _import_yahoofinancials() before the request
+        # was submitted, so this is only a lookup in sys.modules.
+        from yahoofinancials import YahooFinancials
+
+        # The response is decoded by YahooFinancials itself (json.loads), so the
+        # decoder cannot be replaced from here. Threads overlap on the network wait,
+        # while decoding and parsing hold the GIL.
         yf = YahooFinancials(fund)
         fund_data = yf.get_historical_price_data(
             start_date=start_date,
@@ -106,6 +227,241 @@ def _get_fund_data(fund, start_date, end_date):
     return None
 
 
+def _fetch_fund_data(symbol, start_date, end_date):
+    """Retrieve parsed data for fund, using the in-process cache when possible.
+
+    Cached data is held as tuples and a new list is built from it on every call, so
+    that callers may change the returned data without changing the cached data.
+
+    Args:
+        symbol (str): First parameter. Fund symbol. ex. 'FBGRX'.
+        start_date (str or None): Second parameter. Start date (yyyy-mm-dd) for data
+            retrieval. When None, two years before the current date.
+        end_date (str or None): Third parameter. End date (yyyy-mm-dd) for data
+            retrieval. When None, the current date.
+
+    Returns:
+        desired_data (list[symbol, denomination, type, list[[date, price]]]): List of
+            fund data, or None when no prices are available.
+    """
+
+    # Resolve default dates here so the in-process cache is keyed on actual dates.
+    start_date = start_date or two_years_ago_date()
+    end_date = end_date or current_date()
+
+    cached_data = _cached_fetch_fund_data(symbol, start_date, end_date)
+    if cached_data is None:
+        return None
+
+    symbol, currency, instrument_type, dates_prices = cached_data
+
+    return [symbol, currency, instrument_type, list(map(list, dates_prices))]
+
+
+@functools.lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def _cached_fetch_fund_data(symbol, start_date, end_date):
+    """Retrieve parsed data for fund, frozen into tuples for the in-process cache.
+
+    Args:
+        symbol (str): First parameter. Fund symbol. ex. 'FBGRX'.
+        start_date (str): Second parameter. Start date (yyyy-mm-dd) for data retrieval.
+        end_date (str): Third parameter. End date (yyyy-mm-dd) for data retrieval.
+
+    Returns:
+        cached_data (tuple(symbol, denomination, type, tuple[(date, price)])): Tuple of
+            fund data, or None when no prices are available.
+    """
+
+    desired_data = _retrieve_fund_data(symbol, start_date, end_date)
+    if desired_data is None:
+        return None
+
+    symbol, currency, instrument_type, dates_prices = desired_data
+
+    return symbol, currency, instrument_type, tuple(map(tuple, dates_prices))
+
+
+def _retrieve_fund_data(symbol, start_date, end_date):
+    """Retrieve parsed data for fund, using the on-disk cache when possible.
+
+    On a cache miss the dates are expanded to whole weeks before data is retrieved and
+    saved to the cache. Data outside the argument dates is removed before returning.
+    When no prices are returned, for example for a delisted fund, None is returned
+    without parsing or caching the response. None is also returned when no prices fall
+    between the argument dates, for example when they only cover a weekend.
+
+    Args:
+        symbol (str): First parameter. Fund symbol. ex. 'FBGRX'.
+        start_date (str): Second parameter. Start date (yyyy-mm-dd) for data retrieval.
+        end_date (str): Third parameter. End date (yyyy-mm-dd) for data retrieval.
+
+    Returns:
+        desired_data (list[symbol, denomination, type, list[[date, price]]]): List of
+            fund data, or None when no prices are available.
+    """
+
+    _check_dates(start_date, end_date)
+
+    cache = _get_cache()
+    if cache is not None:
+        try:
+            desired_data = cache.get(symbol, start_date, end_date)
+        except CacheError:
+            desired_data = None  # Caching is optional, data is retrieved instead.
+        if desired_data is not None:
+            return _prices_or_none(desired_data)
+
+    week_start, week_end = _snap_dates(start_date, end_date)
+    fund_data = _get_fund_data(symbol, week_start, week_end)
+
+    if not fund_data or not fund_data.get(symbol, {}).get(_PRICES):
+        log.warning('Empty price series for %s.', symbol)
+        return None
+
+    desired_data = _parse_fund_data(fund_data)
+
+    if cache is not None:
+        try:
+            cache.put(desired_data, week_start, week_end)
+        except CacheError:
+            pass  # Caching is optional, data is still returned.
+
+    # Remove dates outside the argument dates. ISO dates can be compared as strings.
+    desired_data[3] = [dp for dp in desired_data[3] if start_date <= dp[0] <= end_date]
+
+    return _prices_or_none(desired_data)
+
+
+def _prices_or_none(desired_data):
+    """Return fund data only when it holds at least one price.
+
+    Args:
+        desired_data (list[symbol, denomination, type, list[[date, price]]]): First
+            parameter. List of fund data.
+
+    Returns:
+        desired_data (list[symbol, denomination, type, list[[date, price]]]): The
+            argument data, or None when it holds no prices.
+    """
+
+    if not desired_data[3]:
+        log.warning('No prices for %s between the requested dates.', desired_data[0])
+        return None
+
+    return desired_data
+
+
+def _get_cache():
+    """Get the shared PriceCache, opening it on first use.
+
+    Args:
+        None
+
+    Returns:
+        (PriceCache or None): The shared cache, or None when it cannot be opened or
+            has been disabled.
+    """
+
+    global _CACHE
+
+    if not _CACHE_ENABLED:
+        return None
+
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            try:
+                _CACHE = PriceCache()
+                atexit.register(_CACHE.close)
+            except CacheError:
+                return None
+
+    return _CACHE
+
+
+def _import_yahoofinancials(symbols, start_date, end_date):
+    """Import yahoofinancials on the calling thread when any fund misses the cache.
+
+    Importing yahoofinancials is the largest cost of starting the application, so it
+    is deferred until data is retrieved over the network, and avoided entirely when
+    data is found in the cache. Importing before requests are submitted to the shared
+    thread pool keeps the import out of their timeout.
+
+    Args:
+        symbols (list[str]): First parameter. Symbols for funds. Ex: ['FXAIX'].
+        start_date (str or None): Second parameter. Start date (yyyy-mm-dd) for data
+            retrieval. When None, two years before the current date.
+        end_date (str or None): Third parameter. End date (yyyy-mm-dd) for data
+            retrieval. When None, the current date.
+
+    Returns:
+        None
+    """
+
+    if 'yahoofinancials' in sys.modules:
+        return
+
+    start_date = start_date or two_years_ago_date()
+    end_date = end_date or current_date()
+
+    cache = _get_cache()
+    if cache is not None:
+        try:
+            if all(cache.covers(symbol, start_date, end_date) for symbol in symbols):
+                return
+        except CacheError:
+            pass  # Data is retrieved over the network instead.
+
+    try:
+        importlib.import_module('yahoofinancials')
+    except ImportError:
+        pass  # Reported by _get_fund_data() when data is retrieved.
+
+
+def disable_cache():
+    """Stop using the on-disk cache for the rest of the run.
+
+    Data is then always retrieved from YahooFinancials, and is not saved to the cache.
+    Repeated requests within the run are still answered from the in-process cache.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    global _CACHE_ENABLED
+
+    log.debug('Disable cache.')
+
+    _CACHE_ENABLED = False
+
+
+def _snap_dates(start_date, end_date):
+    """Expand dates to the start and end of their weeks.
+
+    Aligning retrievals to week boundaries means requests made on different days
+    retrieve the same ranges, so that later requests are more likely to be cached.
+
+    Args:
+        start_date (str): First parameter. yyyy-mm-dd.
+        end_date (str): Second parameter, yyyy-mm-dd.
+
+    Returns:
+        tuple(week_start, week_end): Monday on or before start_date and Sunday on or
+            after end_date, limited to the current date.
+    """
+
+    # Dates have already been validated by _check_dates().
+    start_date = date.fromisoformat(start_date)
+    end_date = date.fromisoformat(end_date)
+
+    week_start = start_date - timedelta(days=start_date.weekday())
+    week_end = min(end_date + timedelta(days=6 - end_date.weekday()), date.today())
+
+    return week_start.isoformat(), week_end.isoformat()
+
+
 def _check_dates(start_date, end_date):
     """Confirm dates are in the correct format and range.
 
@@ -191,8 +547,9 @@ def _check_symbol(symbol):
 def get_yf_fund_data(
         symbol,
         name=None,
-        start_date=TWO_YEARS_AGO_DATE,
-        end_date=CURRENT_DATE
+        start_date=None,
+        end_date=None,
+        strategy=DEFAULT_FETCH_STRATEGY
 ):
     """Get fund data from yahoofinancial between date arguments.
 
@@ -204,33 +561,207 @@ def get_yf_fund_data(
         name (str): Second parameter. OPTIONAL. An unofficial unique
                 identifying name chosen by user to represent fund.
         start_date (str): Third parameter. OPTIONAL. Start date for date range.
-        end_date (str): Fourth parameter. OPTIONAL. End date for date range.
+            Defaults to two years before the current date.
+        end_date (str): Fourth parameter. OPTIONAL. End date for date range. Defaults
+            to the current date.
+        strategy (str): Fifth parameter. OPTIONAL. Key in FETCH_STRATEGIES
+            identifying how data is retrieved. 'pool' retrieves data on the shared
+            thread pool with a timeout, 'sync' retrieves data on the calling thread.
 
     Returns:
         desired_data (list[symbol, denomination, type, list[[date, price]], name]):
-            List of fund data or None.
+            List of fund data or None. None when the request times out or no
+            prices are available.
+
+    Raises:
+        PullDataError (Error): When strategy is not legal.
     """
 
-    log.debug(f'get_yf_fund_data (symbol: {symbol}, name: {name})...')
+    # Arguments are formatted lazily, only when debug logging is enabled.
+    log.debug('get_yf_fund_data (symbol: %s, name: %s)...', symbol, name)
 
-    result = _get_fund_data(symbol, start_date, end_date)
+    try:
+        fetch = FETCH_STRATEGIES[strategy]
+    except KeyError:
+        msg = f'Fetch strategy: {strategy}, is not legal. Available strategies: ' \
+              f'{tuple(FETCH_STRATEGIES)}.'
+        log.warning(msg)
+        raise PullDataError(msg)
 
-    # Put data into acceptable format for caller.
-    desired_data = _parse_fund_data(result)
+    desired_data = fetch(symbol, start_date, end_date)
+    if desired_data is None:
+        return None
 
     # Append custom saved name for fund.
     if name:
         desired_data.append(name)
 
-    log.debug(f'get_yf_fund_data (symbol: {symbol}, name: {name}) complete.')
+    log.debug('get_yf_fund_data (symbol: %s, name: %s) complete.', symbol, name)
 
     return desired_data
 
 
+# Allow the in-process cache to be emptied, for example between tests.
+get_yf_fund_data.cache_clear = _cached_fetch_fund_data.cache_clear
+
+
+def _fetch_pool(symbol, start_date, end_date):
+    """Retrieve data for fund on the shared thread pool, waiting until timeout.
+
+    Args:
+        symbol (str): First parameter. Fund symbol. ex. 'FBGRX'.
+        start_date (str): Second parameter. Start date (yyyy-mm-dd) for data retrieval.
+        end_date (str): Third parameter. End date (yyyy-mm-dd) for data retrieval.
+
+    Returns:
+        (list[symbol, denomination, type, list[[date, price]]] or None): List of fund
+            data, or None when the request times out or no prices are available.
+    """
+
+    _import_yahoofinancials([symbol], start_date, end_date)
+
+    future = _EXECUTOR.submit(_fetch_fund_data, symbol, start_date, end_date)
+    try:
+        return future.result(timeout=DEFAULT_THREAD_TIMEOUT)
+    except FutureTimeoutError:
+        msg = f'Request for fund: {symbol} timed out after {DEFAULT_THREAD_TIMEOUT} ' \
+              f'seconds.'
+        log.warning(msg)
+        return None
+
+
+async def aget_yf_fund_data(
+        symbol,
+        name=None,
+        start_date=None,
+        end_date=None
+):
+    """Asynchronous version of get_yf_fund_data().
+
+    YahooFinancials only provides blocking requests, so the request is run on the
+    shared thread pool and awaited from the running event loop.
+
+    Args:
+        symbol (str): First parameter. Symbol for Fund. Ex: 'FXAIX'.
+        name (str): Second parameter. OPTIONAL. An unofficial unique
+                identifying name chosen by user to represent fund.
+        start_date (str): Third parameter. OPTIONAL. Start date for date range.
+            Defaults to two years before the current date.
+        end_date (str): Fourth parameter. OPTIONAL. End date for date range. Defaults
+            to the current date.
+
+    Returns:
+        desired_data (list[symbol, denomination, type, list[[date, price]], name]):
+            List of fund data or None. None when the request times out or no
+            prices are available.
+    """
+
+    # Only needed by callers already running an event loop, so not imported by
+    # synchronous callers.
+    import asyncio
+
+    log.debug('aget_yf_fund_data (symbol: %s, name: %s)...', symbol, name)
+
+    loop = asyncio.get_running_loop()
+    # Import without a timeout, on the pool rather than blocking the event loop.
+    await loop.run_in_executor(
+        _EXECUTOR,
+        _import_yahoofinancials,
+        [symbol],
+        start_date,
+        end_date
+    )
+    try:
+        desired_data = await asyncio.wait_for(
+            loop.run_in_executor(
+                _EXECUTOR,
+                _fetch_fund_data,
+                symbol,
+                start_date,
+                end_date
+            ),
+            timeout=DEFAULT_THREAD_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        msg = f'Request for fund: {symbol} timed out after {DEFAULT_THREAD_TIMEOUT} ' \
+              f'seconds.'
+        log.warning(msg)
+        return None
+
+    if desired_data is None:
+        return None
+
+    # Append custom saved name for fund.
+    if name:
+        desired_data.append(name)
+
+    log.debug('aget_yf_fund_data (symbol: %s, name: %s) complete.', symbol, name)
+
+    return desired_data
+
+
+def get_yf_funds_data(symbols, start_date=None, end_date=None):
+    """Get fund data from yahoofinancial for multiple funds over the same dates.
+
+    Work shared by every fund, checking dates, opening the cache and importing
+    yahoofinancials, is done once before all requests are submitted to the shared
+    thread pool. Every request shares a single timeout.
+
+    Args:
+        symbols (iterable[str]): First parameter. Symbols for funds. Ex: ['FXAIX'].
+        start_date (str): Second parameter. OPTIONAL. Start date for date range.
+            Defaults to two years before the current date.
+        end_date (str): Third parameter. OPTIONAL. End date for date range. Defaults
+            to the current date.
+
+    Returns:
+        funds_data (list[list[symbol, denomination, type, list[[date, price]]]]): List
+            of fund data in the same order as symbols. None in place of a fund which
+            timed out, failed, or has no prices.
+    """
+
+    log.debug('get_yf_funds_data...')
+
+    symbols = list(symbols)
+    start_date = start_date or two_years_ago_date()
+    end_date = end_date or current_date()
+    _check_dates(start_date, end_date)
+    _import_yahoofinancials(symbols, start_date, end_date)
+
+    futures = [
+        _EXECUTOR.submit(_fetch_fund_data, symbol, start_date, end_date)
+        for symbol in symbols
+    ]
+    done, not_done = wait(futures, timeout=DEFAULT_THREAD_TIMEOUT)
+
+    if not_done:
+        log.warning('Requests for %s of %s funds timed out after %s seconds.',
+                    len(not_done), len(futures), DEFAULT_THREAD_TIMEOUT)
+        # Requests still queued would only delay later requests, so are not started.
+        for future in not_done:
+            future.cancel()
+
+    funds_data = []
+    for future in futures:
+        if future not in done:
+            funds_data.append(None)
+        elif future.exception() is not None:
+            log.warning('Request for fund failed: %s', future.exception())
+            funds_data.append(None)
+        else:
+            funds_data.append(future.result())
+
+    log.debug('get_yf_funds_data complete.')
+
+    return funds_data
+
+
 def _parse_fund_data(data):
     """Convert pulled data from YahooFinancials into a list of desired
     fund attributes.
 
+    Rows are built from the columns returned by _parse_fund_columns().
+
     Args:
         data (dict): Dictionary containing raw fund data from
             YahooFinancials.
@@ -251,80 +782,107 @@ def _parse_fund_data(data):
                 ['symbol', 'currency', 'instrument type', [[dates & prices]]]
     """
 
+    columns = _parse_fund_columns(data)
+    if columns is None:
+        return None
+
+    symbol, currency, instrument_type, dates, prices = columns
+
+    # Inner lists are kept mutable for callers.
+    dates_prices = list(map(list, zip(dates, prices)))
+
+    return [symbol, currency, instrument_type, dates_prices]
+
+
+def _parse_fund_columns(data):
+    """Convert pulled data from YahooFinancials into fund attributes with dates and
+    prices held in separate columns.
+
+    Columns avoid building a list for every row, and are the preferred form for
+    callers which work with dates and prices separately.
+
+    Args:
+        data (dict): Dictionary containing raw fund data from YahooFinancials. See
+            _parse_fund_data().
+
+    Returns:
+        None or columns (list): List containing desired data from argument data
+            dictionary.
+            Example:
+                ['symbol', 'currency', 'instrument type', (dates), (prices)]
+    """
+
+    symbol = next(iter(data))  # Fund symbol is the first key.
+
     # Show symbol for fund being parsed.
-    log.debug('Parse fund data ({})...'.format([k for k in data][0]))
+    log.debug('Parse fund columns (%s)...', symbol)
+
+    fund_data = data[symbol]
 
     # Check the structure of the argument.
-    if not _check_data_structure(data):
+    if not _check_data_structure(fund_data):
         return None
 
-    key = tuple(data.keys())
-    symbol = key[0]
-    currency = data[symbol]['currency']
-    instrument_type = data[symbol]['instrumentType']
-    all_dates_prices = data[symbol]['prices']
-    dates_prices = \
-        [[day['formatted_date'], day['close']] for day in all_dates_prices]
+    currency = fund_data[_CURRENCY]
+    instrument_type = fund_data[_INSTRUMENT_TYPE]
+
+    dates, prices = _extract_columns(fund_data[_PRICES])
 
-    desired_data = [symbol, currency, instrument_type, dates_prices]
+    columns = [symbol, currency, instrument_type, dates, prices]
 
     # Show symbol for fund being parsed.
-    log.debug('Parse fund data ({}) complete.'.format([k for k in data][0]))
+    log.debug('Parse fund columns (%s) complete.', symbol)
 
-    return None or desired_data
+    return columns
 
 
-def _check_data_structure(data):
+def _extract_columns(rows):
+    """Extract date and closing price columns from YahooFinancials price rows.
+
+    This is the only per row work done when parsing, and is kept free of module state
+    so that it can be profiled or replaced in isolation.
+
+    Args:
+        rows (list[dict]): Price rows from YahooFinancials. Each row must contain the
+            keys 'formatted_date' and 'close'.
+
+    Returns:
+        tuple(dates, prices): Tuple of dates (yyyy-mm-dd) and tuple of closing prices.
+    """
+
+    # Transpose rows of (date, price) into a dates column and a prices column.
+    return tuple(zip(*map(_DATE_PRICE, rows))) or ((), ())
+
+
+def _check_data_structure(fund_data):
     """Confirm the structure of data.
 
     Args:
-        data (dict[other dict & lists]): Data with complex structure.
+        fund_data (dict[other dict & lists]): Data for a single fund, as found under
+            the fund symbol in data returned by YahooFinancials.
 
     Returns:
         (Bool(True)): True when date conditions are met.
 
     Raises:
-        ControllerForYfError (Error): When data structure is not legal.
+        PullDataError (Error): When data structure is not legal.
     """
 
-    for k, v in data.items():
-        if not 'eventsData':
-            msg = f'Data dictionary missing: eventsData.'
-            log.warning(msg)
-            raise PullDataError(msg)
-
-        elif not 'dividends':
-            msg = f'Data dictionary missing: dividends.'
-            log.warning(msg)
-            raise PullDataError(msg)
-
-        elif 'firstTradeDate' not in v:
-            msg = f'Data dictionary missing: firstTradeDate.'
-            log.warning(msg)
-            raise PullDataError(msg)
-
-        elif 'currency' not in v:
-            msg = f'Data dictionary missing: currency.'
-            log.warning(msg)
-            raise PullDataError(msg)
+    missing = [key for key in REQUIRED_FUND_KEYS if key not in fund_data]
 
-        elif 'instrumentType' not in v:
-            msg = f'Data dictionary missing: instrumentType.'
-            log.warning(msg)
-            raise PullDataError(msg)
+    if missing:
+        msg = f'Data dictionary missing: {", ".join(missing)}.'
+        log.warning(msg)
+        raise PullDataError(msg)
 
-        elif 'timeZone' not in v:
-            msg = f'Data dictionary missing: timeZone.'
-            log.warning(msg)
-            raise PullDataError(msg)
+    return True
 
-        elif 'prices' not in v:
-            msg = f'Data dictionary missing: prices.'
-            log.warning(msg)
-            raise PullDataError(msg)
 
-        else:
-            return True
+# Available strategies for retrieving data. Maps name to retrieval function.
+FETCH_STRATEGIES = {
+    'pool': _fetch_pool,
+    'sync': _fetch_fund_data,
+}
 
 
 def test():
@@ -355,17 +913,6 @@ def pull_from_yf_self_test():
 if __name__ == '__main__':
 
     # Configure Rotating Log. Only runs when module is called directly.
-    handler = handlers.RotatingFileHandler(
-        filename=DEFAULT_LOG_FILENAME,
-        maxBytes=100 ** 3,  # 0.953674 Megabytes.
-        backupCount=1
-    )
-    formatter = logging.Formatter(
-        f'[%(asctime)s] - {RUNTIME_ID} - %(levelname)s - [%(name)s:%(lineno)s] - '
-        f'%(message)s'
-    )
-    handler.setFormatter(formatter)
-    log.addHandler(handler)
-    log.setLevel(DEFAULT_LOG_LEVEL)
+    configure_logging(log, DEFAULT_LOG_FILENAME, DEFAULT_LOG_LEVEL)
 
     pull_from_yf_self_test()
@@ -66,7 +66,6 @@ Attributes:
     DEFAULT_FILENAME: Default name for data file.
     DEFAULT_STORAGE_LOG_FILENAME: Default filename for logging when module called
         directly.
-    RUNTIME_ID: Generate a unique uuid object. Used in logging.
 
 Composition Attributes:
     Line length = 88 characters.
@@ -74,16 +73,16 @@ Composition Attributes:
 
 import csv
 import logging
-import uuid
-from logging import handlers
 from os.path import exists
 
+# Local imports.
+from log_config import configure_logging
+
 CORE_LOG_LEVEL = logging.WARNING
 CSV_STORAGE_FIELDS = ('symbol', 'name')
 DEFAULT_FILE_TYPE = '.csv'
 DEFAULT_FILENAME = 'data'
 DEFAULT_STORAGE_LOG_FILENAME = 'storage.log'  # Used when __name__ == '__main__'
-RUNTIME_ID = uuid.uuid4()
 
 # Configure logging.
 log = logging.getLogger(__name__)
@@ -128,7 +127,7 @@ class Repo:
             with that name if one does not exist. If False, will use default file name.
         """
 
-        log.debug(f'Loading from {file_name}...')
+        log.debug('Loading from %s...', file_name)
 
         try:
             result = self._file_type_handler(file_name, 'load')
@@ -139,7 +138,7 @@ class Repo:
         except BaseException:
             result = []
         finally:
-            log.debug(f'Length of result: {len(result)}.')
+            log.debug('Length of result: %s.', len(result))
             return result
 
     def save(self, data, file_name=None):
@@ -154,11 +153,11 @@ class Repo:
             saved_data (list[Fund obj] or list['symbol', 'name']): Data which was saved.
         """
 
-        log.debug(f'Saving data to {file_name}...')
+        log.debug('Saving data to %s...', file_name)
 
         saved_data = self._file_type_handler(file_name, save_load='save', data=data)
 
-        log.debug(f'Saving data to {file_name} complete.')
+        log.debug('Saving data to %s complete.', file_name)
 
         return saved_data
 
@@ -184,7 +183,7 @@ class Repo:
             (StorageError): When file_name or save_load arguments are not legal.
         """
 
-        log.debug(f'Handling file type for {file_name}...')
+        log.debug('Handling file type for %s...', file_name)
 
         # Check argument save_load.
         if save_load != 'save' and save_load != 'load':
@@ -198,13 +197,15 @@ class Repo:
                   'extension.'.format('.')
             raise StorageError(msg)
 
+        file_type = file_name.split('.')[1]  # Split once, reused below.
+
         # Raise error if file type is not legal.
-        if file_name.split('.')[1] not in self.FILE_TYPES_HANDLERS:
-            msg = 'File type {} is not a legal type.'.format(file_name.split('.')[1])
+        if file_type not in self.FILE_TYPES_HANDLERS:
+            msg = 'File type {} is not a legal type.'.format(file_type)
             raise StorageError(msg)
 
         # Identify appropriate handler method based on file type and call method.
-        method = self.FILE_TYPES_HANDLERS[file_name.split('.')[1]]
+        method = self.FILE_TYPES_HANDLERS[file_type]
         result = method(file_name, save_load, data)
         return result
 
@@ -223,7 +224,7 @@ class Repo:
             Result from called method.
         """
 
-        log.debug(f'Handling .csv file: {file_name}, action: {save_load}...')
+        log.debug('Handling .csv file: %s, action: %s...', file_name, save_load)
 
         if save_load == 'save':
             return self._save_csv(data, file_name)
@@ -245,17 +246,16 @@ class Repo:
             StorageError (Exception): when argument file does not exist.
         """
 
-        log.debug(f'Loading from {file_name}...')
+        log.debug('Loading from %s...', file_name)
         
         if exists(file_name):
-            funds = []
-            with open(file_name, 'r') as csvfile:
+            with open(file_name, 'r', newline='') as csvfile:
                 csv_reader = csv.reader(csvfile)
-                fields = next(csv_reader)
-                for fund in csv_reader:
-                    funds.append(fund)
+                next(csv_reader)  # Skip header row.
+                # Rows are collected by list() rather than appended one at a time.
+                funds = list(csv_reader)
 
-            log.debug(f'Loading from {file_name} complete.')
+            log.debug('Loading from %s complete.', file_name)
 
             return funds
 
@@ -275,15 +275,7 @@ class Repo:
             data (list[Fund obj] or list['symbol', 'name']): Data that was saved.
         """
 
-        log.debug(f'Saving file to {file_name}...')
-
-        # Prepare argument for context manager.
-        if exists(file_name):
-            log.debug(f'File {file_name} does not yet exist.')
-            write_option = 'w'  # w = Open for writing, truncate the file first.
-        else:
-            log.debug(f'File {file_name} found.')
-            write_option = 'x'  # x = Create a new file and open it for writing.
+        log.debug('Saving file to %s...', file_name)
 
         # Construct list[tuples(symbol, name)].
         try:
@@ -294,15 +286,17 @@ class Repo:
         except AttributeError:
             symbol_name = [(d[0], d[1]) for d in data]
 
-        log.debug(f'Writing data to {file_name}...')
+        log.debug('Writing data to %s...', file_name)
 
-        # Write data to file.
-        with open(file_name, write_option) as csvfile:
+        # Write data to file. w = Open for writing, creating the file when it does not
+        # exist and truncating it otherwise. Rows are buffered and written together
+        # when the file is closed.
+        with open(file_name, 'w', newline='') as csvfile:
             csv_writer = csv.writer(csvfile)
             csv_writer.writerow(CSV_STORAGE_FIELDS)
             csv_writer.writerows(symbol_name)
 
-        log.debug(f'Writing data to {file_name} complete.')
+        log.debug('Writing data to %s complete.', file_name)
 
         return data
 
@@ -334,17 +328,6 @@ def storage_self_test():
 
 if __name__ == '__main__':
     # Configure Rotating Log. Only runs when module is called directly.
-    handler = handlers.RotatingFileHandler(
-        filename=DEFAULT_STORAGE_LOG_FILENAME,
-        maxBytes=100**3,  # 0.953674 Megabytes.
-        backupCount=1
-    )
-    formatter = logging.Formatter(
-        f'[%(asctime)s] - {RUNTIME_ID} - %(levelname)s - [%(name)s:%(lineno)s] - '
-        f'%(message)s'
-    )
-    handler.setFormatter(formatter)
-    log.addHandler(handler)
-    log.setLevel(CORE_LOG_LEVEL)
+    configure_logging(log, DEFAULT_STORAGE_LOG_FILENAME, CORE_LOG_LEVEL)
 
     storage_self_test()
@@ -0,0 +1,194 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""This module is used to test cache.py."""
+import os
+import sqlite3
+import unittest
+from datetime import date, datetime, timedelta
+
+# External Imports
+from cache import _combine_ranges, CacheError, PriceCache
+from tests.test_assets import DESIRED_DATA
+
+
+DEFAULT_CACHE_TEST_FILENAME = 'test_cache.sqlite'
+
+
+class TestApplication(unittest.TestCase):
+    """Test cache.py."""
+
+    @classmethod
+    def setUpClass(cls):
+        pass
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        """Open test cache."""
+
+        self.cache = PriceCache(DEFAULT_CACHE_TEST_FILENAME)
+
+    def tearDown(self):
+        """Close test cache and delete test files."""
+
+        self.cache.close()
+
+        # Delete test file and SQLite journal files, so each test starts empty.
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(DEFAULT_CACHE_TEST_FILENAME + suffix):
+                os.remove(DEFAULT_CACHE_TEST_FILENAME + suffix)
+
+    def test_get(self):
+        """Test get."""
+
+        self.cache.put(DESIRED_DATA, '2022-03-28', '2022-04-03')
+
+        # Confirm data within the cached range is returned.
+        self.assertEqual(
+            DESIRED_DATA,
+            self.cache.get(DESIRED_DATA[0], '2022-03-28', '2022-04-03')
+        )
+        self.assertEqual(
+            DESIRED_DATA,
+            self.cache.get(DESIRED_DATA[0], '2022-04-01', '2022-04-02')
+        )
+
+        # Confirm None is returned when dates are outside the cached range.
+        self.assertIsNone(self.cache.get(DESIRED_DATA[0], '2022-03-01', '2022-04-02'))
+        self.assertIsNone(self.cache.get(DESIRED_DATA[0], '2022-04-01', '2022-05-01'))
+
+        # Confirm None is returned for a fund which is not cached.
+        self.assertIsNone(self.cache.get('INVALID', '2022-03-28', '2022-04-03'))
+
+    def test_covers(self):
+        """Test covers."""
+
+        self.cache.put(DESIRED_DATA, '2022-03-28', '2022-04-03')
+
+        # Confirm coverage matches whether get answers from the cache.
+        self.assertTrue(self.cache.covers(DESIRED_DATA[0], '2022-04-01', '2022-04-02'))
+        self.assertFalse(self.cache.covers(DESIRED_DATA[0], '2022-03-01', '2022-04-02'))
+        self.assertFalse(self.cache.covers('INVALID', '2022-03-28', '2022-04-03'))
+
+    def test_get_error(self):
+        """Test get raises CacheError when the cache cannot be read."""
+
+        self.cache.close()
+        with self.assertRaises(CacheError):
+            self.cache.get(DESIRED_DATA[0], '2022-03-28', '2022-04-03')
+
+    def test_get_expired(self):
+        """Test get expires prices for the day of retrieval."""
+
+        today = date.today().isoformat()
+        self.cache.put(DESIRED_DATA, '2022-03-28', today)
+
+        # Confirm prices including the day of retrieval are returned until they expire.
+        self.assertEqual(
+            DESIRED_DATA, self.cache.get(DESIRED_DATA[0], '2022-03-28', today))
+        self.cache.ttl = -1
+        self.assertIsNone(self.cache.get(DESIRED_DATA[0], '2022-03-28', today))
+
+        # Confirm prices for earlier days do not expire.
+        self.assertEqual(
+            DESIRED_DATA, self.cache.get(DESIRED_DATA[0], '2022-03-28', '2022-04-03'))
+
+    def test_get_expired_after_earlier_put(self):
+        """Test retrieving earlier dates does not refresh the day of retrieval."""
+
+        symbol = DESIRED_DATA[0]
+        today = date.today()
+        week_ago = (today - timedelta(days=7)).isoformat()
+        yesterday = (today - timedelta(days=1)).isoformat()
+        self.cache.put(DESIRED_DATA, week_ago, today.isoformat())
+
+        # Backdate the retrieval beyond the ttl.
+        retrieved = datetime.now() - timedelta(seconds=self.cache.ttl + 60)
+        self.cache._connection.execute(
+            'UPDATE meta SET provisional_fetch = ? WHERE symbol = ?',
+            (retrieved.isoformat(timespec='seconds'), symbol)
+        )
+
+        # Confirm a later retrieval of earlier, overlapping dates does not refresh the
+        # prices for the day of retrieval, while the earlier dates are answered.
+        self.cache.put(DESIRED_DATA, '2022-03-28', week_ago)
+        self.assertIsNone(self.cache.get(symbol, week_ago, today.isoformat()))
+        self.assertEqual(DESIRED_DATA, self.cache.get(symbol, '2022-03-28', yesterday))
+
+        # Confirm the provisional day is final once retrieved on a later day.
+        self.cache._connection.execute(
+            'UPDATE meta SET provisional_date = ? WHERE symbol = ?',
+            (yesterday, symbol)
+        )
+        self.assertIsNone(self.cache.get(symbol, week_ago, yesterday))
+        self.cache.put(DESIRED_DATA, week_ago, yesterday)
+        self.assertIsNotNone(self.cache.get(symbol, week_ago, yesterday))
+
+    def test_put(self):
+        """Test put."""
+
+        # Confirm put returns the data which was saved.
+        self.assertEqual(
+            DESIRED_DATA,
+            self.cache.put(DESIRED_DATA, '2022-03-28', '2022-04-03')
+        )
+
+        # Confirm overlapping ranges are combined.
+        self.cache.put(DESIRED_DATA, '2022-04-01', '2022-04-10')
+        self.assertEqual(
+            DESIRED_DATA,
+            self.cache.get(DESIRED_DATA[0], '2022-03-28', '2022-04-10')
+        )
+
+    def test_put_error(self):
+        """Test put raises CacheError when the cache cannot be written."""
+
+        # Hold a write lock from a second connection, so that BEGIN fails.
+        other = sqlite3.connect(DEFAULT_CACHE_TEST_FILENAME, isolation_level=None)
+        self.addCleanup(other.close)
+        other.execute('BEGIN IMMEDIATE')
+        self.cache._connection.execute('PRAGMA busy_timeout=0')
+
+        # Confirm the original error is reported rather than a failed ROLLBACK.
+        with self.assertRaisesRegex(CacheError, 'locked'):
+            self.cache.put(DESIRED_DATA, '2022-03-28', '2022-04-03')
+        other.execute('ROLLBACK')
+
+    def test_put_separate_ranges(self):
+        """Test put keeps ranges which do not overlap."""
+
+        symbol = DESIRED_DATA[0]
+        later = DESIRED_DATA[:3] + [[['2022-05-03', 90.0]]]
+        self.cache.put(DESIRED_DATA, '2022-03-28', '2022-04-03')
+        self.cache.put(later, '2022-05-02', '2022-05-08')
+
+        # Confirm both ranges are answered, but not the dates between them.
+        self.assertEqual(
+            DESIRED_DATA, self.cache.get(symbol, '2022-03-28', '2022-04-03'))
+        self.assertEqual(later, self.cache.get(symbol, '2022-05-02', '2022-05-08'))
+        self.assertIsNone(self.cache.get(symbol, '2022-03-28', '2022-05-08'))
+
+        # Confirm prices retrieved again replace the cached prices for those dates.
+        self.cache.put(DESIRED_DATA[:3] + [[]], '2022-03-28', '2022-04-03')
+        self.assertEqual([], self.cache.get(symbol, '2022-03-28', '2022-04-03')[3])
+
+    def test_combine_ranges(self):
+        """Test _combine_ranges."""
+
+        # Confirm overlapping and adjacent ranges are combined, and others are kept.
+        self.assertEqual(
+            [('2022-01-01', '2022-01-20'), ('2022-03-01', '2022-03-07')],
+            _combine_ranges([
+                ('2022-03-01', '2022-03-07'),
+                ('2022-01-11', '2022-01-20'),
+                ('2022-01-01', '2022-01-10'),
+                ('2022-01-05', '2022-01-08'),
+            ])
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,21 @@
 
 """This module is used to tes core.py"""
 
+import math
 import unittest
+from unittest import mock
+from array import array
+from datetime import date
 
 # External Imports
-from core import CoreError, Fund
+from core import \
+    _parse_date, \
+    _parse_dates, \
+    BULK_PARSE_THRESHOLD, \
+    calculate_percentage, \
+    calculate_percentages, \
+    CoreError, \
+    Fund
 from tests.test_assets import (
     INITIALIZED_FUND_STR,
     INITIALIZED_FUND_REPR,
@@ -43,13 +54,68 @@ class TestApplication(unittest.TestCase):
         self.assertEqual(self.fund_1.currency, POST_INITIALIZED_FUND_1[1])
         self.assertEqual(self.fund_1.instrument_type, POST_INITIALIZED_FUND_1[2])
         self.assertEqual(self.fund_1.dates_prices, POST_INITIALIZED_FUND_1[3])
+        self.assertEqual(
+            self.fund_1.dates, tuple(dp[0] for dp in POST_INITIALIZED_FUND_1[3]))
+        self.assertEqual(
+            self.fund_1.prices,
+            array('d', [dp[1] for dp in POST_INITIALIZED_FUND_1[3]])
+        )
         self.assertEqual(self.fund_1.name, POST_INITIALIZED_FUND_1[4])
 
+    def test_initialization_interned(self):
+        """Test funds share interned symbol, currency and type strings."""
+
+        fund = Fund(*PRE_INITIALIZED_FUND_1)
+        self.assertIs(self.fund_1.symbol, fund.symbol)
+        self.assertIs(self.fund_1.currency, fund.currency)
+        self.assertIs(self.fund_1.instrument_type, fund.instrument_type)
+
+    def test_initialization_from_iterator(self):
+        """Test object instantiation from an iterator of dates and prices."""
+
+        fund = Fund(*PRE_INITIALIZED_FUND_1[:3], iter(PRE_INITIALIZED_FUND_1[3]))
+        self.assertEqual(fund.dates_prices, POST_INITIALIZED_FUND_1[3])
+
+    def test_from_data(self):
+        """Test from_data."""
+
+        # Confirm the fund matches one created from the same arguments.
+        data, name = PRE_INITIALIZED_FUND_1[:4], PRE_INITIALIZED_FUND_1[4]
+        fund = Fund.from_data(data, name=name)
+        self.assertEqual(self.fund_1.dates_prices, fund.dates_prices)
+        self.assertEqual(self.fund_1.name, fund.name)
+
+        # Confirm an empty name is treated as no name.
+        self.assertIsNone(Fund.from_data(data, name='').name)
+
+    def test_initialization_missing_prices(self):
+        """Test missing prices are held as NaN and returned as None."""
+
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [['2022-01-03', None]])
+        self.assertTrue(math.isnan(fund.prices[0]))
+        self.assertEqual([[date(2022, 1, 3), None]], fund.dates_prices)
+
     def test__str__(self):
         """Test __str__."""
 
         # Test self.fund.__str__() against expected string output.
         self.assertEqual(self.fund_1.__str__(), INITIALIZED_FUND_STR)
+        # Confirm the string is reused, and rebuilt when the name changes.
+        self.assertIs(self.fund_1.__str__(), self.fund_1.__str__())
+        self.fund_1.name = 'renamed'
+        self.assertEqual('FXAIX - renamed', str(self.fund_1).split('\n')[0])
+
+        # Confirm a latest price of 0.0 is shown, and a missing price is skipped.
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            ['2022-01-03', 10.5],
+            ['2022-01-04', 0.0],
+        ])
+        self.assertTrue(str(fund).endswith('$0.00'))
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            ['2022-01-03', 10.5],
+            ['2022-01-04', None],
+        ])
+        self.assertTrue(str(fund).endswith('$10.50'))
 
     def test__repr__(self):
         """Test __repr__."""
@@ -70,8 +136,181 @@ class TestApplication(unittest.TestCase):
         # Confirm that fund finds itself and a different symbol to be unequal.
         self.assertFalse(self.fund_1.__eq__(PRE_INITIALIZED_FUND_2[0]))
 
-        # Confirm that exception is raised when argument is not a Fund or str.
-        self.assertRaises(CoreError, self.fund_1.__eq__, 123)
+        # Confirm that other types are not comparable, and are therefore unequal.
+        self.assertIs(self.fund_1.__eq__(123), NotImplemented)
+        self.assertFalse(self.fund_1 == 123)
+        self.assertFalse(None in [self.fund_1])
+
+    def test__hash__(self):
+        """Test __hash__."""
+
+        # Confirm that funds can be found in a set by fund or by symbol.
+        funds = {self.fund_1, self.fund_2}
+        self.assertIn(Fund(*PRE_INITIALIZED_FUND_1), funds)
+        self.assertIn(PRE_INITIALIZED_FUND_1[0], funds)
+
+    def test_get_most_current_price(self):
+        """Test get_most_current_price."""
+
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            ['2022-01-03', 0.0],
+            ['2022-01-04', 10.5],
+            ['2022-01-05', None],
+        ])
+
+        # Confirm trailing dates without prices are skipped, and 0.0 is a price.
+        self.assertEqual((date(2022, 1, 4), 10.5), fund.get_most_current_price())
+        self.assertEqual(
+            (date(2022, 1, 3), 0.0), fund.get_most_current_price(date(2022, 1, 3)))
+        # Confirm dates beyond the last date use the latest price.
+        self.assertEqual(
+            (date(2022, 1, 4), 10.5), fund.get_most_current_price(date(2023, 1, 1)))
+
+        # Confirm a historical date without a price uses the price before it, not the
+        # latest price in the fund.
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            ['2022-01-03', 1.0],
+            ['2022-01-04', None],
+            ['2022-01-05', 3.0],
+        ])
+        self.assertEqual(
+            (date(2022, 1, 3), 1.0), fund.get_most_current_price(date(2022, 1, 4)))
+
+        # Confirm a date between dates, such as a weekend, uses the date before it, and
+        # a date before all dates uses the first date.
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            ['2022-01-07', 1.0],
+            ['2022-01-10', 2.0],
+        ])
+        self.assertEqual(
+            (date(2022, 1, 7), 1.0), fund.get_most_current_price(date(2022, 1, 9)))
+        self.assertEqual(
+            (date(2022, 1, 7), 1.0), fund.get_most_current_price(date(2022, 1, 1)))
+
+        # Confirm error is raised when no price is available.
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [['2022-01-03', None]])
+        with self.assertRaises(CoreError):
+            fund.get_most_current_price()
+
+    def test_performance_cached(self):
+        """Test day, week and year performance are calculated once."""
+
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            ['2021-01-04', 50.0],
+            ['2022-01-03', 90.0],
+            ['2022-01-04', 100.0],
+        ])
+
+        with mock.patch.object(
+                Fund, 'get_most_current_price', wraps=fund.get_most_current_price
+        ) as get_price:
+            for _ in range(2):
+                self.assertEqual(
+                    [fund.day_performance(), fund.week_performance(),
+                     fund.year_performance()],
+                    [-10.0, 50.0, 50.0]
+                )
+
+        # Confirm prices are only looked up on the first request.
+        self.assertEqual(4, get_price.call_count)
+
+    def test_get_closest_dates(self):
+        """Test get_closest_dates."""
+
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            ['2022-01-03', 1.0],
+            ['2022-01-04', None],
+            ['2022-01-05', 3.0],
+            ['2022-01-06', None],
+            ['2022-01-07', 5.0],
+        ])
+
+        # Confirm dates without prices are skipped at both ends of the range.
+        self.assertEqual(
+            [[date(2022, 1, 3), 1.0], [date(2022, 1, 4), None],
+             [date(2022, 1, 5), 3.0]],
+            fund.get_closest_dates(date(2022, 1, 4), date(2022, 1, 6))
+        )
+        # Confirm a start date after the end date returns the end date.
+        self.assertEqual(
+            [[date(2022, 1, 5), 3.0]],
+            fund.get_closest_dates(date(2022, 1, 8), date(2022, 1, 6))
+        )
+        # Confirm error is raised when no price is available before the end date,
+        # rather than wrapping around to the end of the fund.
+        with self.assertRaises(CoreError):
+            Fund('ABC', 'USD', 'MUTUALFUND', [['2022-01-03', None], ['2022-01-04', 1.0]]
+                 ).get_closest_dates(date(2022, 1, 1), date(2022, 1, 3))
+
+        # Confirm the fund is not changed, including by changes to the result.
+        fund.get_closest_dates(date(2022, 1, 4), date(2022, 1, 6)).clear()
+        self.assertEqual(5, len(fund.dates))
+        self.assertEqual(
+            fund.get_closest_dates(date(2022, 1, 3), date(2022, 1, 7)),
+            fund.dates_prices
+        )
+
+    def test_graph(self):
+        """Test graph."""
+
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            [f'2022-01-{day:02}', price] for day, price in
+            enumerate([10.0, 14.0, 16.0, 20.0, 11.0], start=3)
+        ])
+        rows = fund.graph(height=3, length=5).split('\n')
+
+        # Confirm the highest and lowest prices are drawn on the top and bottom rows.
+        self.assertEqual('   * |$20.00', rows[0])
+        self.assertEqual(' **  |', rows[1])
+        self.assertEqual('*   *|$10.00', rows[2])
+
+    def test_trim_list(self):
+        """Test _trim_list."""
+
+        lst = [[i, float(i)] for i in range(10)]
+
+        # Confirm every frequency'th item is picked and the middle excess is trimmed.
+        self.assertEqual([0, 2, 6, 8], [dp[0] for dp in self.fund_1._trim_list(lst, 4)])
+        self.assertEqual(lst[::2], self.fund_1._trim_list(lst, 5))
+        # Confirm all items are kept when there are fewer than length.
+        self.assertEqual(lst, self.fund_1._trim_list(lst, 20))
+
+    def test_calculate_percentage(self):
+        """Test calculate_percentage."""
+
+        # Confirm difference is relative to the larger price and signed by direction.
+        self.assertEqual(50.0, calculate_percentage(50, 100))
+        self.assertEqual(-50.0, calculate_percentage('100', '50'))
+        self.assertEqual(0.0, calculate_percentage(80.0, 80.0))
+
+    def test_calculate_percentages(self):
+        """Test calculate_percentages matches calculate_percentage."""
+
+        firsts, lasts = [100, 50.0, '80.0'], [50, 100.0, '80.0']
+        self.assertEqual(
+            [calculate_percentage(f, l) for f, l in zip(firsts, lasts)],
+            calculate_percentages(firsts, lasts)
+        )
+
+    def test_parse_date(self):
+        """Test _parse_date."""
+
+        # Confirm that date strings are converted to the matching date object.
+        self.assertEqual(date(2022, 4, 5), _parse_date('2022-04-05'))
+        self.assertEqual(date(1999, 12, 31), _parse_date('1999-12-31'))
+
+        # Confirm that repeated dates are served from the cache.
+        self.assertIs(_parse_date('2022-04-05'), _parse_date('2022-04-05'))
+
+    def test_parse_dates(self):
+        """Test _parse_dates."""
+
+        # Confirm short and long lists of dates are converted in order.
+        short = ['2022-04-05', '1999-12-31']
+        self.assertEqual((date(2022, 4, 5), date(1999, 12, 31)), _parse_dates(short))
+        long = short * BULK_PARSE_THRESHOLD
+        self.assertEqual((date(2022, 4, 5), date(1999, 12, 31)) * BULK_PARSE_THRESHOLD,
+                         _parse_dates(long))
 
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 """This module is used to test fund_tracker.py"""
+import copy
 import random
 import unittest
 
@@ -58,12 +59,47 @@ class TestApplication(unittest.TestCase):
     def test_instantiate_saved_funds(self):
         """Test instantiate_saved_funds."""
 
-        pass
+        data = {fund[0]: fund[:4] for fund in (PRE_INSTANTIATED_FUND_1,
+                                               PRE_INSTANTIATED_FUND_2)}
+
+        def source_method(symbol, start_date=None, end_date=None):
+            if symbol not in data:
+                raise ValueError(symbol)
+            return copy.deepcopy(data[symbol])
+
+        def batch_method(symbols):
+            return [copy.deepcopy(data.get(symbol)) for symbol in symbols]
+
+        # Replace data sources to prevent network calls.
+        self.ft.pull_yahoofinancial = source_method
+        self.ft.pull_yahoofinancial_batch = batch_method
+
+        # Confirm funds are returned in order, with None for a fund that fails, both
+        # with a single batch call and with one call per fund.
+        batch_funds = self.ft.instantiate_saved_funds()
+        self.ft.AVAILABLE_BATCH_DATA_SOURCES = {}
+        funds = self.ft.instantiate_saved_funds()
+        for result in (batch_funds, funds):
+            self.assertEqual(
+                self.ft.symbols_names[:2], [[f.symbol, f.name] for f in result[:2]])
+            self.assertIsNone(result[2])
 
     def test_instantiate_fund(self):
         """Test instantiate_fund."""
 
-        pass
+        def source_method(symbol, start_date=None, end_date=None):
+            if symbol != PRE_INSTANTIATED_FUND_1[0]:
+                raise ValueError(symbol)
+            return copy.deepcopy(PRE_INSTANTIATED_FUND_1[:4])
+
+        # Replace data source to prevent network calls.
+        self.ft.pull_yahoofinancial = source_method
+
+        # Confirm fund is instantiated with name, and None is returned on failure.
+        fund = self.ft.instantiate_fund(PRE_INSTANTIATED_FUND_1[0], name='name')
+        self.assertEqual(PRE_INSTANTIATED_FUND_1[0], fund.symbol)
+        self.assertEqual('name', fund.name)
+        self.assertIsNone(self.ft.instantiate_fund('OTHER'))
 
     def test_check_data_source(self):
         """Test check_data_source."""
@@ -104,7 +140,27 @@ class TestApplication(unittest.TestCase):
         # Confirm found fund is None when a fund does not exist.
         self.assertEqual(None, self.ft.find_fund('INVALID'))
 
-    def delete_fund(self):
+        # Confirm the symbol index follows replacement and deletion of funds.
+        first, second = Fund(*PRE_INSTANTIATED_FUND_1), Fund(*PRE_INSTANTIATED_FUND_1)
+        self.ft.funds = [None, first, second]
+        self.assertIs(first, self.ft.find_fund(first.symbol))
+        self.assertIs(first, self.ft.delete_fund(first.symbol))
+        self.assertIs(second, self.ft.find_fund(first.symbol))
+        self.ft.delete_fund(first.symbol)
+        self.assertIsNone(self.ft.find_fund(first.symbol))
+        self.assertEqual([None], self.ft.funds)
+
+    def test_is_saved(self):
+        """Test is_saved."""
+
+        # Confirm saved funds are found, including one which was not instantiated.
+        self.assertTrue(self.ft.is_saved(self.ft.funds[0].symbol))
+        self.ft.symbols_names.append(['ABC', None])
+        self.assertIsNone(self.ft.find_fund('ABC'))
+        self.assertTrue(self.ft.is_saved('ABC'))
+        self.assertFalse(self.ft.is_saved('INVALID'))
+
+    def test_delete_fund(self):
         """Test delete_fund."""
 
         # Fund object for testing.
@@ -114,18 +170,32 @@ class TestApplication(unittest.TestCase):
         self.assertIn(fund, self.ft.funds)
 
         # Delete fund.
-        self.delete_fund(fund.symbol)
+        self.assertIs(fund, self.ft.delete_fund(fund.symbol))
 
-        # Confirm fund is deleted from self.ft.funds.
+        # Confirm fund is deleted from self.ft.funds and saved data.
         self.assertNotIn(fund, self.ft.funds)
+        self.assertNotIn(fund.symbol, [s_n[0] for s_n in self.ft.symbols_names])
 
-        # Add fund back to self.ft.funds to not interfere with other testing.
-        self.ft.funds.append(fund)
+        # Confirm a fund which was saved but not instantiated can be deleted.
+        self.ft.symbols_names.append(['ABC', None])
+        self.assertIs(True, self.ft.delete_fund('ABC'))
+        self.assertIs(False, self.ft.delete_fund('ABC'))
 
     def test_generate_all_fund_perf_str(self):
         """Test generate_all_fund_perf_str."""
 
-        pass
+        fund = Fund('ABC', 'USD', 'MUTUALFUND', [
+            ['2022-01-03', 10.0],
+            ['2022-01-04', 11.0],
+            ['2022-01-05', 12.0]
+        ])
+        self.ft.funds = [fund, None]
+
+        # Confirm each fund is followed by a separator, and missing funds are skipped.
+        self.assertEqual(
+            '\n' + fund.generate_fund_performance_str() + '\n' + '*' * 100,
+            self.ft.generate_all_fund_perf_str()
+        )
 
     def test_custom_range_performance(self):
         """Test custom_range_performance."""
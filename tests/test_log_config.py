@@ -0,0 +1,59 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""This module is used to test log_config.py."""
+import atexit
+import logging
+import os
+import tempfile
+import unittest
+
+# External Imports
+from log_config import configure_logging, runtime_id
+
+
+class TestApplication(unittest.TestCase):
+    """Test log_config.py."""
+
+    @classmethod
+    def setUpClass(cls):
+        pass
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_configure_logging(self):
+        """Test configure_logging."""
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        filename = os.path.join(temp_dir.name, 'test.log')
+        logger = logging.getLogger('test_log_config')
+        self.addCleanup(logger.handlers.clear)
+
+        listener = configure_logging(logger, filename, logging.INFO)
+        logger.warning('Test warning.')
+        listener.stop()
+        atexit.unregister(listener.stop)
+        for handler in listener.handlers:
+            handler.target.close()
+
+        # Confirm warnings are written without waiting for the buffer to fill.
+        with open(filename) as file:
+            contents = file.read()
+        self.assertIn(runtime_id(), contents)
+        self.assertIn('WARNING', contents)
+        self.assertIn('Test warning.', contents)
+        self.assertEqual(logging.INFO, logger.level)
+
+    def test_runtime_id(self):
+        """Test runtime_id."""
+
+        # Confirm the same id is returned for the whole run.
+        self.assertEqual(32, len(runtime_id()))
+        self.assertEqual(runtime_id(), runtime_id())
+
+
+if __name__ == '__main__':
+    unittest.main()
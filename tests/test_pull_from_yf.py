@@ -3,18 +3,36 @@
 
 """This module is used to test pull_from_yf.py"""
 
+import asyncio
 import copy
+import os
+import sys
+import tempfile
+import threading
 import unittest
-from datetime import date
-from dateutil.relativedelta import relativedelta
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from datetime import date, timedelta
 
 # Local imports.
 from pull_from_yf import \
     _check_dates, \
     _check_symbol, \
     _get_fund_data, \
+    _parse_fund_columns, \
     _parse_fund_data, \
-    PullDataError
+    _retrieve_fund_data, \
+    _get_cache, \
+    _import_yahoofinancials, \
+    _years_ago, \
+    aget_yf_fund_data, \
+    current_date, \
+    disable_cache, \
+    get_yf_fund_data, \
+    get_yf_funds_data, \
+    PullDataError, \
+    two_years_ago_date
+from cache import CacheError, PriceCache
 from tests.test_assets import DESIRED_DATA, RAW_FUND_DATA
 
 
@@ -72,7 +90,7 @@ class TestApplication(unittest.TestCase):
             _check_dates('2020-01-01', '2020-01-01')
             _check_dates('2020-01-02', '2020-01-01')
             # End date is greater than the current date. end_date = tomorrow.
-            _check_dates('2020-01-01', (date.today() + relativedelta(days=1)).__str__())
+            _check_dates('2020-01-01', (date.today() + timedelta(days=1)).__str__())
 
     def test_check_symbol(self):
         """Test _check_symbol."""
@@ -96,10 +114,253 @@ class TestApplication(unittest.TestCase):
             # Fund uses an illegal character.
             _check_symbol('a*a')
 
+    def test_default_dates(self):
+        """Test default date functions."""
+
+        # Confirm default dates are relative to the current date.
+        self.assertEqual(date.today().isoformat(), current_date())
+        self.assertEqual(date.today().year - 2, int(two_years_ago_date()[:4]))
+
+        # Confirm February 29th is moved to the 28th when the earlier year has no 29th.
+        self.assertEqual(date(2022, 2, 28), _years_ago(date(2024, 2, 29), 2))
+        self.assertEqual(date(2020, 2, 29), _years_ago(date(2024, 2, 29), 4))
+
+    def test_disable_cache(self):
+        """Test disable_cache."""
+
+        # Confirm the on-disk cache is not used once disabled.
+        with mock.patch('pull_from_yf._CACHE_ENABLED', True):
+            disable_cache()
+            self.assertIsNone(_get_cache())
+
     def test_get_yf_fund_data(self):
         """Test get_yf_fund_data."""
 
-        pass
+        # Confirm error is raised when fetch strategy is not legal.
+        with self.assertRaises(PullDataError):
+            get_yf_fund_data('F', strategy='invalid')
+
+    def test_get_yf_fund_data_cached(self):
+        """Test repeated get_yf_fund_data requests are answered from memory."""
+
+        get_yf_fund_data.cache_clear()
+        self.addCleanup(get_yf_fund_data.cache_clear)
+
+        with mock.patch('pull_from_yf._get_cache', return_value=None), \
+                mock.patch('pull_from_yf._get_fund_data',
+                           return_value=copy.deepcopy(RAW_FUND_DATA)) as get_data:
+            first = get_yf_fund_data(
+                'VITPX', 'name', '2022-03-28', '2022-04-03', strategy='sync')
+            expected_first = copy.deepcopy(first)
+            first[3][0][1] = None  # Changes by callers must not reach the cache.
+            second = get_yf_fund_data(
+                'VITPX', None, '2022-03-28', '2022-04-03', strategy='sync')
+
+        # Confirm data is only retrieved once, and the name is not cached.
+        get_data.assert_called_once()
+        self.assertEqual(DESIRED_DATA + ['name'], expected_first)
+        self.assertEqual(DESIRED_DATA, second)
+
+    def test_get_yf_fund_data_empty(self):
+        """Test get_yf_fund_data returns None when no prices are returned."""
+
+        get_yf_fund_data.cache_clear()
+        self.addCleanup(get_yf_fund_data.cache_clear)
+
+        empty = copy.deepcopy(RAW_FUND_DATA)
+        empty['VITPX']['prices'] = []
+
+        with mock.patch('pull_from_yf._get_cache', return_value=None), \
+                mock.patch('pull_from_yf._get_fund_data', return_value=empty):
+            self.assertIsNone(get_yf_fund_data(
+                'VITPX', 'name', '2022-03-28', '2022-04-03', strategy='sync'))
+
+    def test_get_yf_fund_data_timeout(self):
+        """Test get_yf_fund_data returns None when the default strategy times out."""
+
+        get_yf_fund_data.cache_clear()
+        self.addCleanup(get_yf_fund_data.cache_clear)
+
+        # Release the blocked request once the test is complete. A symbol used by no
+        # other test keeps its late result out of their way.
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def get_fund_data(symbol, start_date, end_date):
+            release.wait(1)
+            return {'SLOW': copy.deepcopy(RAW_FUND_DATA['VITPX'])}
+
+        with mock.patch('pull_from_yf._get_cache', return_value=None), \
+                mock.patch('pull_from_yf._get_fund_data', side_effect=get_fund_data), \
+                mock.patch('pull_from_yf.DEFAULT_THREAD_TIMEOUT', 0.01):
+            self.assertIsNone(
+                get_yf_fund_data('SLOW', 'name', '2022-03-28', '2022-04-03'))
+
+    def test_get_yf_funds_data(self):
+        """Test get_yf_funds_data."""
+
+        get_yf_fund_data.cache_clear()
+        self.addCleanup(get_yf_fund_data.cache_clear)
+
+        with mock.patch('pull_from_yf._get_cache', return_value=None), \
+                mock.patch('pull_from_yf._get_fund_data',
+                           return_value=copy.deepcopy(RAW_FUND_DATA)):
+            funds_data = get_yf_funds_data(
+                ['VITPX', 'OTHER'], '2022-03-28', '2022-04-03')
+
+        # Confirm results are in the order requested, with None for missing data.
+        self.assertEqual([DESIRED_DATA, None], funds_data)
+
+    def test_aget_yf_fund_data(self):
+        """Test aget_yf_fund_data."""
+
+        # Confirm the name is appended to the fund data.
+        with mock.patch('pull_from_yf._fetch_fund_data',
+                        return_value=copy.deepcopy(DESIRED_DATA)):
+            self.assertEqual(
+                DESIRED_DATA + ['name'],
+                asyncio.run(aget_yf_fund_data(
+                    'VITPX', 'name', '2022-03-28', '2022-04-03'))
+            )
+
+        # Confirm None is returned when no prices are available.
+        with mock.patch('pull_from_yf._fetch_fund_data', return_value=None):
+            self.assertIsNone(asyncio.run(aget_yf_fund_data(
+                'VITPX', 'name', '2022-03-28', '2022-04-03')))
+
+    def test_aget_yf_fund_data_timeout(self):
+        """Test aget_yf_fund_data returns None when the request times out."""
+
+        # Release the blocked request once the test is complete.
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fetch_fund_data(symbol, start_date, end_date):
+            release.wait(1)
+            return copy.deepcopy(DESIRED_DATA)
+
+        with mock.patch('pull_from_yf._fetch_fund_data', side_effect=fetch_fund_data), \
+                mock.patch('pull_from_yf.DEFAULT_THREAD_TIMEOUT', 0.01):
+            self.assertIsNone(asyncio.run(aget_yf_fund_data(
+                'VITPX', 'name', '2022-03-28', '2022-04-03')))
+
+    def test_get_yf_funds_data_timeout(self):
+        """Test get_yf_funds_data cancels requests which have not started."""
+
+        get_yf_fund_data.cache_clear()
+        self.addCleanup(get_yf_fund_data.cache_clear)
+
+        # A single worker, blocked by the first request, leaves the second queued.
+        executor = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        self.addCleanup(executor.shutdown)
+        self.addCleanup(release.set)
+
+        def get_fund_data(symbol, start_date, end_date):
+            release.wait(1)
+            return {}
+
+        with mock.patch('pull_from_yf._get_cache', return_value=None), \
+                mock.patch('pull_from_yf._get_fund_data',
+                           side_effect=get_fund_data) as stub, \
+                mock.patch('pull_from_yf._EXECUTOR', executor), \
+                mock.patch('pull_from_yf.DEFAULT_THREAD_TIMEOUT', 0.01):
+            funds_data = get_yf_funds_data(
+                ['SLOW', 'QUEUED'], '2022-03-28', '2022-04-03')
+            release.set()
+            executor.shutdown()
+
+        # Confirm both funds timed out and the queued request was never started.
+        self.assertEqual([None, None], funds_data)
+        self.assertEqual(['SLOW'], [call.args[0] for call in stub.call_args_list])
+
+    def test_import_yahoofinancials(self):
+        """Test _import_yahoofinancials only imports when a fund misses the cache."""
+
+        cache = mock.Mock()
+        cache.covers.side_effect = lambda symbol, start_date, end_date: \
+            symbol == 'VITPX'
+
+        with mock.patch.dict(sys.modules), \
+                mock.patch('pull_from_yf._get_cache', return_value=cache), \
+                mock.patch('importlib.import_module') as import_module:
+            sys.modules.pop('yahoofinancials', None)
+
+            # Confirm nothing is imported when every fund is cached.
+            _import_yahoofinancials(['VITPX'], '2022-03-28', '2022-04-03')
+            import_module.assert_not_called()
+
+            # Confirm yahoofinancials is imported when any fund is not cached.
+            _import_yahoofinancials(['VITPX', 'FXAIX'], '2022-03-28', '2022-04-03')
+            import_module.assert_called_once_with('yahoofinancials')
+
+            # Confirm the import is not repeated once yahoofinancials is imported.
+            sys.modules['yahoofinancials'] = mock.Mock()
+            _import_yahoofinancials(['FXAIX'], '2022-03-28', '2022-04-03')
+            import_module.assert_called_once()
+
+    def test_retrieve_fund_data_cache_error(self):
+        """Test _retrieve_fund_data retrieves data when the cache cannot be read."""
+
+        cache = mock.Mock()
+        cache.get.side_effect = CacheError('locked')
+
+        with mock.patch('pull_from_yf._get_cache', return_value=cache), \
+                mock.patch('pull_from_yf._get_fund_data',
+                           return_value=copy.deepcopy(RAW_FUND_DATA)):
+            self.assertEqual(
+                DESIRED_DATA,
+                _retrieve_fund_data('VITPX', '2022-03-28', '2022-04-03')
+            )
+
+    def test_retrieve_fund_data_cached(self):
+        """Test _retrieve_fund_data retrieves whole weeks and then uses the cache."""
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cache = PriceCache(os.path.join(temp_dir.name, 'test_cache.sqlite'))
+        self.addCleanup(cache.close)
+
+        # A week of weekday prices, as Yahoo Finance does not report weekends.
+        raw_fund_data = copy.deepcopy(RAW_FUND_DATA)
+        row = raw_fund_data['VITPX']['prices'][0]
+        raw_fund_data['VITPX']['prices'] = [
+            dict(row, formatted_date='2022-03-%02d' % day, close=float(day))
+            for day in range(28, 32)
+        ] + [row]
+
+        with mock.patch('pull_from_yf._get_cache', return_value=cache), \
+                mock.patch('pull_from_yf._get_fund_data',
+                           return_value=raw_fund_data) as get_fund_data:
+            # Confirm that a miss retrieves the whole week and returns only the
+            # requested dates.
+            test_result = _retrieve_fund_data('VITPX', '2022-03-30', '2022-04-01')
+            get_fund_data.assert_called_once_with('VITPX', '2022-03-28', '2022-04-03')
+            self.assertEqual(
+                [['2022-03-30', 30.0], ['2022-03-31', 31.0],
+                 ['2022-04-01', 80.97000122070312]],
+                test_result[3]
+            )
+
+            # Confirm that other dates in the same week are read from the cache.
+            test_result = _retrieve_fund_data('VITPX', '2022-03-28', '2022-03-29')
+            get_fund_data.assert_called_once()
+            self.assertEqual(
+                ['VITPX', 'USD', 'MUTUALFUND',
+                 [['2022-03-28', 28.0], ['2022-03-29', 29.0]]],
+                test_result
+            )
+
+            # Confirm that None is returned for cached dates without prices.
+            self.assertIsNone(
+                _retrieve_fund_data('VITPX', '2022-04-02', '2022-04-03'))
+            get_fund_data.assert_called_once()
+
+            # Confirm that dates outside the cached week are retrieved, and that None
+            # is returned when the retrieved prices fall outside the requested dates.
+            self.assertIsNone(
+                _retrieve_fund_data('VITPX', '2022-04-04', '2022-04-05'))
+            get_fund_data.assert_called_with('VITPX', '2022-04-04', '2022-04-10')
 
     def test_parse_fund_data(self):
         """Test parse_fund_data."""
@@ -108,6 +369,16 @@ class TestApplication(unittest.TestCase):
         test_result = _parse_fund_data(RAW_FUND_DATA)
         self.assertEqual(DESIRED_DATA, test_result)
 
+    def test_parse_fund_columns(self):
+        """Test _parse_fund_columns."""
+
+        # Confirm that dates and prices are returned as separate columns.
+        symbol, currency, instrument_type, dates, prices = \
+            _parse_fund_columns(RAW_FUND_DATA)
+        self.assertEqual(DESIRED_DATA[:3], [symbol, currency, instrument_type])
+        self.assertEqual([dp[0] for dp in DESIRED_DATA[3]], list(dates))
+        self.assertEqual([dp[1] for dp in DESIRED_DATA[3]], list(prices))
+
     def test_check_data_structure(self):
         """Test _check_data_structure."""
 
@@ -143,6 +414,11 @@ class TestApplication(unittest.TestCase):
             _parse_fund_data(f)
             _parse_fund_data(g)
 
+        # Confirm each missing key is detected, not only the first.
+        for missing in (c, d, e, f, g):
+            with self.assertRaises(PullDataError):
+                _parse_fund_data(missing)
+
 
 if __name__ == '__main__':
     unittest.main()